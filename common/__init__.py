@@ -0,0 +1,7 @@
+"""
+Helpers shared by the application packages.
+"""
+
+from .jsonutil import loads, dumps, JSONDecodeError
+
+__all__ = ['loads', 'dumps', 'JSONDecodeError']
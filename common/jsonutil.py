@@ -0,0 +1,32 @@
+"""
+JSON helpers shared by the application packages.
+Uses orjson when it is installed and falls back to the standard json module.
+"""
+
+import json
+
+# Raised by loads() for invalid data (orjson's error subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+
+    def loads(data: bytes):
+        """Parse JSON bytes (raises json.JSONDecodeError on invalid data)."""
+        return orjson.loads(data)
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to JSON bytes, compact or indented by two spaces."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+except ImportError:  # orjson is optional
+    _encode_compact = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+    def loads(data: bytes):
+        """Parse JSON bytes (raises json.JSONDecodeError on invalid data)."""
+        return json.loads(data)
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to JSON bytes, compact or indented by two spaces."""
+        if indent:
+            return json.dumps(obj, indent=2).encode('utf-8')
+        return _encode_compact(obj).encode('utf-8')
@@ -6,5 +6,6 @@ Implements different driving control modes.
 from .base_mode import BaseDrivingMode
 from .direct_mode import DirectMode
 from .carsim_mode import CarSimMode
+from ._physics import VehicleStateArray
 
-__all__ = ['BaseDrivingMode', 'DirectMode', 'CarSimMode']
+__all__ = ['BaseDrivingMode', 'DirectMode', 'CarSimMode', 'VehicleStateArray']
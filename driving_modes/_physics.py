@@ -0,0 +1,206 @@
+"""
+Physics kernels for the driving modes.
+Compiled to native code with Numba when it is installed, plain Python otherwise.
+"""
+
+import math
+from array import array
+from dataclasses import dataclass
+
+try:
+    from numba import njit, prange
+    import numpy as np  # always present alongside Numba
+
+    def _kernel_view(buf):
+        """Zero-copy ndarray view of a typed array (parallel loops need ndarrays)."""
+        return np.asarray(memoryview(buf))
+except ImportError:  # Numba is optional
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def _kernel_view(buf):
+        """Typed arrays are used as-is by the pure-Python kernels."""
+        return buf
+
+
+@dataclass
+class VehicleStateArray:
+    """
+    Per-vehicle CarSim state for N vehicles, stored as parallel typed arrays
+    (structure of arrays) so a whole fleet can be stepped in one pass.
+    """
+    speed: array     # float32, speed percentage (-100 to 100)
+    gear: array      # int8, -1=Reverse, 0=Neutral, 1-5=Gears
+    throttle: array  # float32, 0-1
+    brake: array     # float32, 0-1
+    cooldown: array  # float32, remaining gear shift cooldown in seconds
+    clutch: array    # uint8, 1 if the clutch is engaged
+
+    @classmethod
+    def create(cls, count: int) -> 'VehicleStateArray':
+        """
+        Create state for `count` vehicles at rest in neutral.
+
+        Args:
+            count: Number of vehicles
+
+        Returns:
+            New VehicleStateArray
+        """
+        return cls(
+            speed=array('f', bytes(4 * count)),
+            gear=array('b', bytes(count)),
+            throttle=array('f', bytes(4 * count)),
+            brake=array('f', bytes(4 * count)),
+            cooldown=array('f', bytes(4 * count)),
+            clutch=array('B', [1]) * count,
+        )
+
+    def __len__(self):
+        return len(self.speed)
+
+
+# log_inertia for an inertia of 0 (no speed carried over). Finite, unlike
+# log(0), so the kernel never computes -inf * 0 (NaN) when dt is 0, and
+# fastmath code never sees an infinity
+NO_INERTIA_LOG = -1.0e30
+
+
+@njit(cache=True, fastmath=True)
+def step_carsim(speed, gear, throttle, brake, clutch, log_inertia, brake_pow,
+                base_acc, accel_factor, max_speed, dt):
+    """
+    Advance the CarSim speed by one frame.
+
+    Args:
+        speed: Current speed percentage (-100 to 100)
+        gear: Current gear (-1=Reverse, 0=Neutral, 1-5=Gears)
+        throttle: Throttle value (0-1)
+        brake: Brake value (0-1)
+        clutch: True if the clutch is engaged
+        log_inertia: Natural log of the inertia (speed retained per second),
+                     NO_INERTIA_LOG for an inertia of 0
+        brake_pow: Brake effectiveness multiplier
+        base_acc: Base acceleration rate (% per second)
+        accel_factor: Acceleration multiplier of the current gear
+        max_speed: Max speed percentage of the current gear
+        dt: Time elapsed since last update in seconds
+
+    Returns:
+        New speed percentage
+    """
+    # Inertia decay for this frame (computed once, shared by all branches)
+    decay_rate = 1.0 - math.exp(log_inertia * dt)
+
+    # Throttle mask: 1.0 or 0.0 (very low threshold for immediate response)
+    has_throttle = 1.0 if throttle > 0.001 else 0.0
+
+    # In gear with the clutch engaged: drive through the gearbox
+    # (throttle is handled by the mask)
+    if gear != 0 and clutch:
+        forward = 1.0 if gear > 0 else 0.0
+
+        # Base acceleration (zero without throttle)
+        base_accel = base_acc * accel_factor * throttle * dt * has_throttle
+
+        # Gear-speed penalty: higher gears need speed to work effectively.
+        # Forward gears need 0%, 15%, 30%, 45%, 60% (gears 1-5) to accelerate freely;
+        # below that the penalty ranges from 0.1 (very slow) to 1.0 (no penalty)
+        min_effective_speed = (gear - 1) * 15.0 * forward
+        speed_deficit = max(min_effective_speed - speed, 0.0) * forward
+        penalty = max(0.1, 1.0 - (speed_deficit / (min_effective_speed + 1.0)) * 0.9)
+        base_accel *= penalty
+
+        # Accelerate only with throttle and below the max speed for this gear,
+        # clamping to that max speed
+        accelerating = has_throttle if speed < max_speed else 0.0
+        accelerated_speed = min(speed + base_accel, max_speed)
+
+        # Otherwise decay with inertia, plus engine braking when over the gear limit:
+        # 1x to 6x braking with throttle, 1x to 5x without
+        speed_over_limit = max(speed - max_speed, 0.0)
+        engine_brake_k = 0.05 * has_throttle + 0.04 * (1.0 - has_throttle)
+        engine_brake_factor = 1.0 + speed_over_limit * engine_brake_k
+        decayed_speed = speed * (1.0 - (decay_rate * engine_brake_factor))
+
+        speed = accelerating * accelerated_speed + (1.0 - accelerating) * decayed_speed
+
+        # Apply brake
+        speed -= brake_pow * brake * 20.0 * dt * (1.0 if brake > 0.01 else 0.0)
+
+        # Apply direction based on gear
+        if gear < 0:  # Reverse
+            # In reverse, limit to negative speed
+            speed = min(speed, 0.0)
+            speed = max(speed, -max_speed)
+        else:
+            # Forward gears
+            speed = max(speed, 0.0)
+
+    else:
+        # Neutral or clutch disengaged - coast with inertia
+        speed *= (1.0 - decay_rate)
+
+        # Apply brake even in neutral
+        if brake > 0.01:
+            brake_deceleration = brake_pow * brake * 20.0 * dt
+            if speed > 0:
+                speed -= brake_deceleration
+            else:
+                speed += brake_deceleration
+
+    # Clamp speed to valid range and snap very low speeds to zero
+    # (conditional expressions lower to min/max/select, no calls or jumps)
+    speed = -100.0 if speed < -100.0 else (100.0 if speed > 100.0 else speed)
+    return 0.0 if -0.1 < speed < 0.1 else speed
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _step_batch_kernel(speed, gear, throttle, brake, clutch, cooldown, accel_table,
+                       max_speed_table, log_inertia, brake_pow, base_acc, dt):
+    """Loop body of step_batch(), over arrays the kernel can index."""
+    num_gears = len(accel_table)
+    for i in prange(len(speed)):
+        if cooldown[i] > 0:
+            cooldown[i] -= dt
+
+        idx = gear[i] + 1
+        if 0 <= idx < num_gears:
+            accel_factor = accel_table[idx]
+            max_speed = max_speed_table[idx]
+        else:
+            accel_factor = 0.0
+            max_speed = 0.0
+
+        speed[i] = step_carsim(speed[i], gear[i], throttle[i], brake[i], clutch[i] != 0,
+                               log_inertia, brake_pow, base_acc, accel_factor, max_speed, dt)
+
+
+def step_batch(speed, gear, throttle, brake, clutch, cooldown, accel_table,
+               max_speed_table, log_inertia, brake_pow, base_acc, dt):
+    """
+    Advance N vehicles by one frame in place.
+
+    Args:
+        speed, gear, throttle, brake, clutch, cooldown: Per-vehicle state arrays
+        accel_table: Acceleration multiplier per gear, indexed by gear + 1
+        max_speed_table: Max speed percentage per gear, indexed by gear + 1
+        log_inertia: Natural log of the inertia (speed retained per second)
+        brake_pow: Brake effectiveness multiplier
+        base_acc: Base acceleration rate (% per second)
+        dt: Time elapsed since last update in seconds
+    """
+    _step_batch_kernel(
+        _kernel_view(speed), _kernel_view(gear), _kernel_view(throttle),
+        _kernel_view(brake), _kernel_view(clutch), _kernel_view(cooldown),
+        accel_table, max_speed_table, log_inertia, brake_pow, base_acc, dt
+    )
+
+
+# Compile once at import so the first frame doesn't pay for it
+step_carsim(0.0, 1, 0.5, 0.0, True, math.log(0.88), 1.0, 12.0, 3.0, 20.0, 1.0 / 60.0)
@@ -4,12 +4,15 @@ All driving modes inherit from this class.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
 
 
 class BaseDrivingMode(ABC):
     """Base class for all driving modes."""
     
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = ('name', 'description', 'active', 'current_gear', 'speed', 'power')
+    
     def __init__(self, name: str, description: str):
         """
         Initialize the driving mode.
@@ -56,6 +59,17 @@ class BaseDrivingMode(ABC):
         """
         pass
     
+    def set_input_schema(self, keys: Iterable[str]):
+        """
+        Called with the input keys provided by the active input configuration.
+        
+        Modes may override this to specialize their input handling.
+        
+        Args:
+            keys: Input keys (mapped action names) present in every frame
+        """
+        pass
+    
     def activate(self):
         """Called when this mode becomes active."""
         self.active = True
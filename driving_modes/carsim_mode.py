@@ -3,9 +3,52 @@ CarSim driving mode.
 Simulates a car with manual transmission and gears.
 """
 
+import logging
 import math
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterable, Tuple
 from .base_mode import BaseDrivingMode
+from ._physics import NO_INERTIA_LOG, VehicleStateArray, step_carsim, step_batch
+
+logger = logging.getLogger(__name__)
+
+
+# Inputs read by process_input, in order, with the value used when absent
+_INPUT_FIELDS = (
+    ('throttle', 0.0),
+    ('brake', 0.0),
+    ('clutch', 0.0),
+    ('shift_up', False),
+    ('shift_down', False),
+)
+
+
+def _build_extractor(available_keys: Iterable[str] = ()) -> Callable[[Dict[str, Any]], Tuple]:
+    """
+    Generate a function returning the _INPUT_FIELDS values of an input dict.
+    
+    Keys listed in `available_keys` are read with a plain d[key]; all others
+    fall back to their default when missing.
+    
+    Args:
+        available_keys: Input keys the active configuration always provides
+        
+    Returns:
+        Function taking the input dict and returning a tuple of values
+    """
+    available = set(available_keys)
+    reads = []
+    for key, default in _INPUT_FIELDS:
+        if key in available:
+            reads.append(f"d[{key!r}]")
+        else:
+            reads.append(f"(d[{key!r}] if {key!r} in d else {default!r})")
+    source = f"def extract(d):\n    return {', '.join(reads)}\n"
+    namespace = {}
+    exec(compile(source, '<carsim-input-extractor>', 'exec'), namespace)
+    return namespace['extract']
+
+
+_generic_extract = _build_extractor()
 
 
 class CarSimMode(BaseDrivingMode):
@@ -16,6 +59,14 @@ class CarSimMode(BaseDrivingMode):
     Higher gears: slower acceleration, higher max speed.
     """
     
+    __slots__ = (
+        'gear_characteristics', '_accel_table', '_max_speed_table',
+        '_inertia', '_log_inertia', 'brake_power', 'base_acceleration',
+        'current_speed_percent', 'clutch_engaged',
+        'shift_cooldown', 'shift_cooldown_time', '_shift_state',
+        'current_throttle', 'current_brake', '_extract',
+    )
+    
     def __init__(self):
         super().__init__(
             name="CarSim",
@@ -34,6 +85,14 @@ class CarSimMode(BaseDrivingMode):
             5: (0.9, 100.0),   # 5th: slowest accel, 100% max speed
         }
         
+        # Flat lookup tables indexed by gear + 1 (-1..5 -> 0..6), used every frame
+        self._accel_table = tuple(
+            self.gear_characteristics[gear][0] for gear in range(-1, 6)
+        )
+        self._max_speed_table = tuple(
+            self.gear_characteristics[gear][1] for gear in range(-1, 6)
+        )
+        
         # Physics parameters (configurable)
         self.inertia = 0.88  # 0-1, how much speed is retained per second (higher = more inertia)
         self.brake_power = 1.0  # Brake effectiveness multiplier
@@ -49,14 +108,26 @@ class CarSimMode(BaseDrivingMode):
         self.shift_cooldown = 0.0
         self.shift_cooldown_time = 0.3  # seconds
         
-        # Previous button states (for detecting button press/release)
-        self.prev_shift_up = False
-        self.prev_shift_down = False
+        # Shift button states (for detecting button press/release), as bits:
+        # 0 = previous up, 1 = current up, 2 = previous down, 3 = current down
+        self._shift_state = 0
         
         # Current input values (updated in process_input)
         self.current_throttle = 0.0
         self.current_brake = 0.0
         
+        # Input extractor, specialized by set_input_schema()
+        self._extract = _generic_extract
+        
+    def set_input_schema(self, keys: Iterable[str]):
+        """
+        Specialize input extraction for the keys the input config provides.
+        
+        Args:
+            keys: Input keys (mapped action names) present in every frame
+        """
+        self._extract = _build_extractor(keys)
+        
     def process_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process input with car simulation.
@@ -68,10 +139,12 @@ class CarSimMode(BaseDrivingMode):
             Processed data with simulated car behavior
         """
         # Extract inputs
-        steering = input_data.get('steering', 0.0)
-        throttle = input_data.get('throttle', 0.0)
-        brake = input_data.get('brake', 0.0)
-        clutch = input_data.get('clutch', 0.0)
+        try:
+            throttle, brake, clutch, shift_up, shift_down = self._extract(input_data)
+        except KeyError:
+            # The device doesn't provide every mapped control; stop assuming it does
+            self._extract = _generic_extract
+            throttle, brake, clutch, shift_up, shift_down = self._extract(input_data)
         
         # Convert throttle/brake from -1,1 to 0,1 range
         throttle_value = (throttle + 1.0) / 2.0  # 0 = no throttle, 1 = full throttle
@@ -85,31 +158,32 @@ class CarSimMode(BaseDrivingMode):
         # Update clutch state
         self.clutch_engaged = clutch_value > 0.5
         
-        # Handle gear shifts
-        shift_up = input_data.get('shift_up', False)
-        shift_down = input_data.get('shift_down', False)
+        # Handle gear shifts: move current bits to previous, store new current bits
+        state = (
+            ((self._shift_state >> 1) & 0b0101)
+            | (0b0010 if shift_up else 0)
+            | (0b1000 if shift_down else 0)
+        )
+        self._shift_state = state
         
-        # Detect button press (transition from False to True)
+        # Detect button press (transition from False to True: current set, previous clear)
         if self.shift_cooldown <= 0:
-            if shift_up and not self.prev_shift_up:
+            if state & 0b0011 == 0b0010:
                 self._shift_up()
-            elif shift_down and not self.prev_shift_down:
+            elif state & 0b1100 == 0b1000:
                 self._shift_down()
         
-        self.prev_shift_up = shift_up
-        self.prev_shift_down = shift_down
-        
         # Update power and speed for telemetry
         self.power = throttle_value * 100.0
         self.speed = self.current_speed_percent
         
-        # Create output data
-        output_data = input_data.copy()
-        output_data['simulated_speed'] = self.speed
-        output_data['simulated_gear'] = self.current_gear
-        output_data['simulated_power'] = self.power
-        
-        return output_data
+        # Create output data (single merge instead of copy + three stores)
+        return {
+            **input_data,
+            'simulated_speed': self.speed,
+            'simulated_gear': self.current_gear,
+            'simulated_power': self.power
+        }
     
     def update(self, delta_time: float):
         """
@@ -123,113 +197,61 @@ class CarSimMode(BaseDrivingMode):
             self.shift_cooldown -= delta_time
         
         # Get current gear characteristics
-        accel_factor, max_speed_percent = self.gear_characteristics.get(
-            self.current_gear, (0.0, 0.0)
-        )
+        idx = self.current_gear + 1
+        if 0 <= idx < 7:
+            accel_factor = self._accel_table[idx]
+            max_speed_percent = self._max_speed_table[idx]
+        else:
+            accel_factor = max_speed_percent = 0.0
         
-        # Physics simulation
-        if self.current_gear != 0 and self.clutch_engaged:
-            # Calculate how much we're over the gear limit (engine braking effect)
-            speed_over_limit = self.current_speed_percent - max_speed_percent
-            
-            # Apply throttle - acceleration based on gear
-            if self.current_throttle > 0.001:  # Very low threshold for immediate response
-                # Calculate base acceleration
-                base_accel = self.base_acceleration * accel_factor * self.current_throttle * delta_time
-                
-                # Apply gear-speed penalty: higher gears need speed to work effectively
-                # Lower gears (1, 2) work well at any speed, higher gears (4, 5) need momentum
-                if self.current_gear > 0:  # Only for forward gears
-                    # Calculate minimum effective speed for this gear (as percentage of max speed)
-                    # Each gear needs at least some speed to work efficiently
-                    min_effective_speed = (self.current_gear - 1) * 15.0  # 0%, 15%, 30%, 45%, 60% for gears 1-5
-                    
-                    if self.current_speed_percent < min_effective_speed:
-                        # Apply penalty: the further below min speed, the harder to accelerate
-                        speed_deficit = min_effective_speed - self.current_speed_percent
-                        # Penalty factor: ranges from 0.1 (very slow) to 1.0 (no penalty)
-                        penalty = max(0.1, 1.0 - (speed_deficit / (min_effective_speed + 1.0)) * 0.9)
-                        base_accel *= penalty
-                
-                acceleration = base_accel
-                
-                # Only accelerate if we haven't reached the max speed for this gear
-                if self.current_speed_percent < max_speed_percent:
-                    # Add acceleration to speed
-                    self.current_speed_percent += acceleration
-                    
-                    # Clamp to max speed for this gear (only when accelerating)
-                    if self.current_speed_percent > max_speed_percent:
-                        self.current_speed_percent = max_speed_percent
-                # If we're above the max speed for this gear, apply engine braking
-                else:
-                    # Engine braking: more aggressive the further over the limit we are
-                    # This simulates downshifting at high speed
-                    over_limit_ratio = speed_over_limit / 100.0  # 0-1 scale
-                    engine_brake_factor = 1.0 + (over_limit_ratio * 5.0)  # 1x to 6x braking
-                    
-                    decay_rate = 1.0 - (self.inertia ** delta_time)
-                    self.current_speed_percent *= (1.0 - (decay_rate * engine_brake_factor))
-            else:
-                # No throttle - apply inertia decay with engine braking if over limit
-                decay_rate = 1.0 - (self.inertia ** delta_time)
-                
-                if speed_over_limit > 0:
-                    # Apply stronger engine braking when over the gear limit
-                    over_limit_ratio = speed_over_limit / 100.0
-                    engine_brake_factor = 1.0 + (over_limit_ratio * 4.0)  # 1x to 5x braking
-                    self.current_speed_percent *= (1.0 - (decay_rate * engine_brake_factor))
-                else:
-                    # Normal inertia decay
-                    self.current_speed_percent *= (1.0 - decay_rate)
-            
-            # Apply brake
-            if self.current_brake > 0.01:
-                brake_deceleration = self.brake_power * self.current_brake * 20.0 * delta_time
-                self.current_speed_percent -= brake_deceleration
-            
-            # Apply direction based on gear
-            if self.current_gear < 0:  # Reverse
-                # In reverse, limit to negative speed
-                self.current_speed_percent = min(self.current_speed_percent, 0)
-                self.current_speed_percent = max(self.current_speed_percent, -max_speed_percent)
-            else:
-                # Forward gears
-                self.current_speed_percent = max(self.current_speed_percent, 0)
+        # Physics simulation (native code when Numba is available)
+        self.current_speed_percent = step_carsim(
+            self.current_speed_percent, self.current_gear,
+            self.current_throttle, self.current_brake, self.clutch_engaged,
+            self._log_inertia, self.brake_power, self.base_acceleration,
+            accel_factor, max_speed_percent, delta_time
+        )
+    
+    def step_batch(self, states: VehicleStateArray, delta_time: float):
+        """
+        Update physics for many vehicles at once using this mode's parameters.
         
-        else:
-            # Neutral or clutch disengaged - coast with inertia
-            decay_rate = 1.0 - (self.inertia ** delta_time)
-            self.current_speed_percent *= (1.0 - decay_rate)
-            
-            # Apply brake even in neutral
-            if self.current_brake > 0.01:
-                brake_deceleration = self.brake_power * self.current_brake * 20.0 * delta_time
-                if self.current_speed_percent > 0:
-                    self.current_speed_percent -= brake_deceleration
-                else:
-                    self.current_speed_percent += brake_deceleration
-        
-        # Clamp speed to valid range
-        self.current_speed_percent = max(-100.0, min(100.0, self.current_speed_percent))
-        
-        # If speed is very low, set to zero
-        if abs(self.current_speed_percent) < 0.1:
-            self.current_speed_percent = 0.0
+        Args:
+            states: Per-vehicle state arrays, updated in place
+            delta_time: Time elapsed since last update in seconds
+        """
+        step_batch(
+            states.speed, states.gear, states.throttle, states.brake,
+            states.clutch, states.cooldown,
+            self._accel_table, self._max_speed_table,
+            self._log_inertia, self.brake_power, self.base_acceleration,
+            delta_time
+        )
+    
+    @property
+    def inertia(self) -> float:
+        """How much speed is retained per second (0-1)."""
+        return self._inertia
+    
+    @inertia.setter
+    def inertia(self, value: float):
+        self._inertia = value
+        # Cached so update() can use exp(log_inertia * dt) instead of pow()
+        self._log_inertia = math.log(value) if value > 0.0 else NO_INERTIA_LOG
     
     def _shift_up(self):
         """Shift to higher gear."""
         if self.current_gear < 5:
             self.current_gear += 1
             self.shift_cooldown = self.shift_cooldown_time
-            print(f"Shifted UP to gear {self.current_gear}")
+            logger.info("Shifted UP to gear %s", self.current_gear)
     
     def _shift_down(self):
         """Shift to lower gear."""
         if self.current_gear > -1:
             self.current_gear -= 1
             self.shift_cooldown = self.shift_cooldown_time
-            print(f"Shifted DOWN to gear {self.current_gear}")
+            logger.info("Shifted DOWN to gear %s", self.current_gear)
     
     def reset(self):
         """Reset simulation state."""
@@ -237,7 +259,6 @@ class CarSimMode(BaseDrivingMode):
         self.current_speed_percent = 0.0
         self.clutch_engaged = True
         self.shift_cooldown = 0.0
-        self.prev_shift_up = False
-        self.prev_shift_down = False
+        self._shift_state = 0
         self.current_throttle = 0.0
         self.current_brake = 0.0
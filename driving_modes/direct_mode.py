@@ -13,6 +13,8 @@ class DirectMode(BaseDrivingMode):
     No simulation, no gear changes, just raw input forwarding.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="Direct",
@@ -23,6 +25,9 @@ class DirectMode(BaseDrivingMode):
         """
         Process input by passing it directly through.
         
+        The input dict itself is returned (no copy), so callers must not
+        mutate the returned data.
+        
         Args:
             input_data: Raw input data from steering wheel and pedals
             
@@ -32,13 +37,9 @@ class DirectMode(BaseDrivingMode):
         # In direct mode, we simply return the input data as-is
         # The output driver will receive exactly what the wheel/pedals send
         
-        # Extract basic values for telemetry display
-        throttle = input_data.get('throttle', 0.0)
-        brake = input_data.get('brake', 0.0)
-        
         # Update telemetry (for display purposes)
-        # Power = throttle intensity
-        self.power = ((throttle + 1.0) / 2.0) * 100.0  # Convert -1,1 to 0-100%
+        # Power = throttle intensity, -1,1 -> 0-100% ((t + 1) / 2 * 100)
+        self.power = input_data.get('throttle', 0.0) * 50.0 + 50.0
         
         # In direct mode, speed follows power directly
         self.speed = self.power  # Speed % matches power %
@@ -46,7 +47,7 @@ class DirectMode(BaseDrivingMode):
         # Direct mode shows 'D' (Drive) instead of a gear number
         self.current_gear = 'D'
         
-        return input_data.copy()
+        return input_data
     
     def update(self, delta_time: float):
         """
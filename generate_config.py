@@ -4,9 +4,14 @@ Helps identify axis and button IDs on your joystick.
 """
 
 import pygame
-import json
+import math
 import os
+from array import array
 from datetime import datetime
+from common import dumps
+
+# Max samples kept per axis during detection (10 s of a 1 kHz wheel)
+AXIS_SAMPLE_CAPACITY = 10000
 
 def detect_joystick_layout():
     """Interactive joystick detection and configuration generator."""
@@ -57,29 +62,46 @@ def detect_joystick_layout():
     
     clock = pygame.time.Clock()
     start_time = pygame.time.get_ticks()
-    axis_activity = {}
+    
+    # Preallocated float32 sample buffer and fill count per axis
+    num_axes = js.get_numaxes()
+    axis_buf = [array('f', bytes(4 * AXIS_SAMPLE_CAPACITY)) for _ in range(num_axes)]
+    axis_count = [0] * num_axes
+    
+    # Let SDL filter the queue so only axis events reach Python
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.JOYAXISMOTION])
     
     while pygame.time.get_ticks() - start_time < 10000:
         for event in pygame.event.get():
-            if event.type == pygame.JOYAXISMOTION:
-                # Only track significant movements (> 0.5)
-                if abs(event.value) > 0.5:
-                    if event.axis not in axis_activity:
-                        axis_activity[event.axis] = []
-                    axis_activity[event.axis].append(event.value)
+            # Only track significant movements (> 0.5)
+            if abs(event.value) > 0.5:
+                i = event.axis
+                if i < num_axes:
+                    c = axis_count[i]
+                    if c < AXIS_SAMPLE_CAPACITY:
+                        axis_buf[i][c] = event.value
+                        axis_count[i] = c + 1
         
-        pygame.event.pump()
-        clock.tick(60)
+        clock.tick(30)
+    
+    # Analyze axis activity: one reduction per axis over the filled part of
+    # its buffer (memoryview slices don't copy)
+    axis_means = [
+        math.fsum(memoryview(buf)[:count]) / max(count, 1)
+        for buf, count in zip(axis_buf, axis_count)
+    ]
+    active_axes = [i for i, count in enumerate(axis_count) if count]
     
-    # Analyze axis activity
     print("\nAxis Activity Detected:")
-    for axis_id in sorted(axis_activity.keys()):
-        values = axis_activity[axis_id]
-        avg_value = sum(values) / len(values)
-        print(f"  axis_{axis_id}: {len(values)} readings, avg={avg_value:+.2f}")
+    for axis_id in active_axes:
+        print(f"  axis_{axis_id}: {axis_count[axis_id]} readings, avg={axis_means[axis_id]:+.2f}")
+    
+    def axis_active(axis_id):
+        return axis_id < num_axes and axis_count[axis_id] > 0
     
     # Suggest mappings based on activity
-    if 0 in axis_activity:
+    if axis_active(0):
         config["axes"]["steering"] = {
             "axis_id": 0,
             "description": "Steering wheel rotation",
@@ -88,7 +110,7 @@ def detect_joystick_layout():
             "sensitivity": 1.0
         }
     
-    if 5 in axis_activity:
+    if axis_active(5):
         config["axes"]["throttle"] = {
             "axis_id": 5,
             "description": "Accelerator pedal",
@@ -97,7 +119,7 @@ def detect_joystick_layout():
             "sensitivity": 1.0
         }
     
-    if 4 in axis_activity:
+    if axis_active(4):
         config["axes"]["brake"] = {
             "axis_id": 4,
             "description": "Brake pedal",
@@ -115,6 +137,9 @@ def detect_joystick_layout():
     
     button_presses = set()
     
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.KEYDOWN, pygame.JOYBUTTONDOWN])
+    
     start_time = pygame.time.get_ticks()
     while pygame.time.get_ticks() - start_time < 20000:
         for event in pygame.event.get():
@@ -125,8 +150,7 @@ def detect_joystick_layout():
                 button_presses.add(event.button)
                 print(f"  Button {event.button} pressed")
         
-        pygame.event.pump()
-        clock.tick(60)
+        clock.tick(30)
     
     # Map detected buttons
     button_names = {
@@ -160,8 +184,8 @@ def detect_joystick_layout():
     
     os.makedirs("input", exist_ok=True)
     
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
+    with open(config_path, 'wb') as f:
+        f.write(dumps(config, indent=True))
     
     print(f"\n✓ Configuration saved to: {config_path}")
     print(f"\nTo use this configuration:")
@@ -4,14 +4,19 @@ Responsive GUI for displaying steering wheel and pedal data.
 
 import pygame
 import sys
+import logging
 import math
 import time
-import requests
+import socket
 import threading
-import json
-import os
+from collections import OrderedDict, deque
+from itertools import chain
 from io import BytesIO
-from PIL import Image, ImageEnhance
+from urllib.parse import urlsplit
+from input import AxisProcessor
+from common import loads
+
+logger = logging.getLogger(__name__)
 
 # Color definitions
 BLACK = (0, 0, 0)
@@ -27,6 +32,101 @@ ORANGE = (255, 165, 0)
 CYAN = (0, 255, 255)
 PURPLE = (200, 0, 255)
 
+# Speed bar color for each whole speed percentage (0-100%):
+# green to yellow up to 50%, yellow to red above
+SPEED_COLORS = tuple(
+    (int(255 * (p / 100 * 2)), 255, 0) if p < 50 else (255, int(255 * (2 - p / 100 * 2)), 0)
+    for p in range(101)
+)
+
+# Transparent color of the cached panel decoration layers (not used by any drawing)
+PANEL_COLORKEY = (255, 0, 255)
+
+# Rate at which the input thread polls the joystick and sends to the outputs (Hz)
+INPUT_RATE = 200
+
+# Unchanged output data is sent again only this often (seconds), as a keepalive
+OUTPUT_KEEPALIVE = 0.5
+
+# Refresh rate of text-only panel content (Hz); numbers changing faster are unreadable
+PANEL_TEXT_RATE = 15
+
+# Rendered text surfaces kept by _render_cached (least recently used are dropped)
+TEXT_CACHE_SIZE = 512
+
+# Tachometer gauge sweep: 135 to 405 degrees (270 degree sweep)
+TACH_START_ANGLE = math.pi * 0.75
+TACH_END_ANGLE = math.pi * 2.25
+
+# Unit circle sampled every 5 degrees, used to draw arcs without per-point trig
+ARC_SEGMENTS = 72
+ARC_STEP = 2 * math.pi / ARC_SEGMENTS
+UNIT_CIRCLE = tuple(
+    (math.cos(i * ARC_STEP), math.sin(i * ARC_STEP)) for i in range(ARC_SEGMENTS)
+)
+
+# Steering indicator tick marks at -90, -45, 0, 45 and 90 degrees (0 = top):
+# (unit direction x, unit direction y, color, width)
+STEERING_TICKS = tuple(
+    (math.cos(math.radians(angle - 90)), math.sin(math.radians(angle - 90)),
+     CYAN if angle == 0 else GRAY, 3 if angle == 0 else 1)
+    for angle in (-90, -45, 0, 45, 90)
+)
+
+
+# PIL transpose (Image attribute name) for a horizontal flip followed by a
+# clockwise rotation: (flip horizontal, rotation degrees) -> method or None
+ORIENTATION_TRANSPOSE = {
+    (False, 0): None,
+    (False, 90): 'ROTATE_270',
+    (False, 180): 'ROTATE_180',
+    (False, 270): 'ROTATE_90',
+    (True, 0): 'FLIP_LEFT_RIGHT',
+    (True, 90): 'TRANSVERSE',
+    (True, 180): 'FLIP_TOP_BOTTOM',
+    (True, 270): 'TRANSPOSE',
+}
+
+
+def _format_axis(value, color):
+    """Format an axis value (-1 to 1); near zero it is shown in gray."""
+    return f"{value:+.2f}", (color if abs(value) > 0.1 else GRAY)
+
+
+def _format_percent(value, color):
+    """Format a simulated percentage; near zero it is shown in gray."""
+    return f"{value:.1f}", (color if abs(value) > 0.1 else GRAY)
+
+
+def _format_count(value, color):
+    """Format an integer value (button state, gear)."""
+    return str(value), color
+
+
+def _format_value(value, color):
+    """Format any value based on its type."""
+    if isinstance(value, float):
+        return _format_axis(value, color)
+    elif isinstance(value, bool):
+        return ("ON" if value else "off"), (color if value else GRAY)
+    elif isinstance(value, int):
+        return str(value), color
+    return str(value), WHITE
+
+
+# Output data panel rows, in display order: (data key, label, color, formatter)
+OUTPUT_PANEL_FIELDS = (
+    ('steering', 'Steering:', CYAN, _format_axis),
+    ('throttle', 'Throttle:', GREEN, _format_axis),
+    ('brake', 'Brake:', RED, _format_axis),
+    ('clutch', 'Clutch:', YELLOW, _format_axis),
+    ('shift_up', 'Shift Up:', LIGHT_GRAY, _format_count),
+    ('shift_down', 'Shift Down:', LIGHT_GRAY, _format_count),
+    ('simulated_speed', 'Speed %:', ORANGE, _format_percent),
+    ('simulated_power', 'Power %:', ORANGE, _format_percent),
+    ('simulated_gear', 'Gear:', PURPLE, _format_count),
+)
+
 
 class SteeringWheelUI:
     """
@@ -55,28 +155,90 @@ class SteeringWheelUI:
         self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
         pygame.display.set_caption("DriveLink2")
         
+        # Pre-rendered static panel layers (fill, decorations), keyed by (panel name, width, height)
+        self._bg_cache = {}
+        
+        # Text-only panel content refreshed at PANEL_TEXT_RATE: {name: (surface, render time)}
+        self._panel_cache = {}
+        
+        # Pre-rendered (released, pressed) button grid tiles, rebuilt on resize
+        self._button_tiles = None
+        
+        # Screen with only the static layers drawn (background, panel backgrounds,
+        # titles), rebuilt on resize; each frame restores from it what it redraws
+        self._composite = None
+        
         # Fonts (will be updated based on screen size)
         self._update_fonts()
         
+        # Debug overlay positions and spacing (updated based on screen size)
+        self._update_overlay_layout()
+        
         self.clock = pygame.time.Clock()
         self.running = False
         self.joystick = None
         
+        # Per-control output keys and axis processing, built from the input
+        # config once the joystick is known (see _build_input_plan)
+        self._axis_processor = None
+        self._input_keys = None  # Output keys of all axes, then buttons, then hats
+        self._button_ids = None
+        self._hat_ids = None
+        self._button_keys = None
+        self._hat_keys = None
+        
+        # Controls changed since the last poll, as bitmasks (bit N = control ID N)
+        # set from joystick events on the main thread and taken by the input thread
+        self._dirty_lock = threading.Lock()
+        self._dirty_axes = 0
+        self._dirty_buttons = 0
+        self._dirty_hats = 0
+        self._joystick_id = None  # Instance ID of self.joystick, to filter events
+        self._raw_data = None  # Last dict returned by _collect_joystick_data
+        
+        # Last data sent to the outputs and when, see _send_joystick_data
+        self._last_sent = None
+        self._last_send_time = 0.0
+        
         # Message log for status panel
-        self.messages = []
         self.max_messages = 10
+        self.messages = deque(maxlen=self.max_messages)  # Oldest dropped automatically
+        self._timestamp_cache = (None, "")  # (second, formatted "HH:MM:SS")
         
         # MJPEG Stream support
         self.stream_url = None
         self.stream_thread = None
         self.stream_running = False
-        self.current_frame = None
+        # Two frame buffers in the display format, allocated on the first frame:
+        # the front one is shown, the reader fills the other and swaps them
+        self._frame_bufs = None
+        self._front_idx = 0
+        self.frame_seq = 0  # Incremented each time the front buffer changes
         self.frame_lock = threading.Lock()
+        self._stream_scaled = None  # Last frame scaled to the video area, reused across frames
+        self._stream_scaled_key = None  # (frame_seq, width, height) of _stream_scaled
+        self._stream_drawn_seq = -1  # frame_seq of the frame on screen
+        # Set once the front buffer has been drawn; until then new frames are
+        # dropped undecoded, so the back buffer is never in use when it is filled
+        self._frame_consumed = threading.Event()
+        self._frame_consumed.set()
+        self._tone_luts = {}  # Brightness/contrast lookup tables, see _tone_lut()
         self.stream_config = {}
         self._load_default_stream_config()
         
         # Time tracking for physics updates
-        self.last_time = time.time()
+        self.last_time = time.perf_counter()
+        
+        # Input thread: polls the joystick, runs the driving mode and sends to
+        # the outputs at INPUT_RATE, publishing each result as a new snapshot
+        # dict (replaced, never modified, so the UI reads it without locking)
+        self._input_thread = None
+        self._telemetry_snapshot = None
+        
+        # Snapshot in use for the current frame, shared by the panels
+        self._frame_data = None  # Raw mapped input
+        self._frame_processed = None  # After the driving mode, as sent to outputs
+        self._frame_telemetry = None  # Driving mode telemetry
         
         # Initialize output manager if config is provided
         self.output_manager = None
@@ -115,6 +277,28 @@ class SteeringWheelUI:
         self.font_large = pygame.font.Font(None, int(base_size * 0.03))  # Reduced from 0.04
         self.font_medium = pygame.font.Font(None, int(base_size * 0.025))  # Reduced from 0.03
         self.font_small = pygame.font.Font(None, int(base_size * 0.02))  # Reduced from 0.025
+        
+        # Rendered text is only valid for the fonts it was rendered with
+        self._text_cache = OrderedDict()
+        
+        # Fonts sized from the layout (gear, steering angle), see _get_font()
+        self._dyn_font_cache = {}
+    
+    def _get_font(self, size):
+        """
+        Get the default font at the given size, creating it on first use.
+        
+        Args:
+            size: Font size in pixels
+            
+        Returns:
+            pygame.font.Font
+        """
+        font = self._dyn_font_cache.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._dyn_font_cache[size] = font
+        return font
     
     def _initialize_output(self):
         """Initialize output manager from config name."""
@@ -152,20 +336,59 @@ class SteeringWheelUI:
     
     def _add_message(self, text: str, color=WHITE):
         """Add a message to the message log."""
-        timestamp = time.strftime("%H:%M:%S")
+        # Format the timestamp only once per second (error bursts add messages every frame)
+        second = int(time.time())
+        cached_second, timestamp = self._timestamp_cache
+        if second != cached_second:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+            self._timestamp_cache = (second, timestamp)
+        
+        # The deque keeps only the last max_messages messages
         self.messages.append({
             'text': text,
             'color': color,
             'time': timestamp
         })
-        # Keep only last N messages
-        if len(self.messages) > self.max_messages:
-            self.messages.pop(0)
         
-    def _draw_text(self, text, pos, font, color=WHITE):
-        """Draw text on the screen."""
-        text_surface = font.render(text, True, color)
-        self.screen.blit(text_surface, pos)
+    def _render_cached(self, text, font, color):
+        """
+        Render text, reusing the surface from a previous call with the same arguments.
+        
+        Args:
+            text: Text to render
+            font: pygame Font (must be one of the UI fonts kept until _update_fonts)
+            color: Text color
+            
+        Returns:
+            Rendered text surface (shared, do not draw on it)
+        """
+        key = (text, id(font), color)
+        cache = self._text_cache
+        text_surface = cache.get(key)
+        if text_surface is None:
+            text_surface = font.render(text, True, color).convert_alpha()
+            cache[key] = text_surface
+            # Changing values (speeds, angles) keep adding entries; evict the
+            # least recently used so static labels stay cached
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return text_surface
+    
+    def _draw_text(self, text, pos, font, color=WHITE, surface=None):
+        """
+        Draw text on the screen, or on `surface` if given.
+        
+        `surface` must be a per-pixel alpha layer cleared to transparent: the
+        text pixels are copied onto it as they are (not blended), so the layer
+        blends like the text itself when it is blitted.
+        """
+        text_surface = self._render_cached(text, font, color)
+        if surface is None:
+            self.screen.blit(text_surface, pos)
+        else:
+            surface.blit(text_surface, pos, special_flags=pygame.BLEND_RGBA_MAX)
         
     def _draw_bar(self, x, y, width, height, value, label):
         """
@@ -204,6 +427,20 @@ class SteeringWheelUI:
         button_size = int(min(self.width, self.height) * 0.05)
         spacing = int(button_size * 0.2)
         
+        # Button tiles (fill and border) for both states, drawn once per size
+        if self._button_tiles is None or self._button_tiles[0].get_width() != button_size:
+            tiles = []
+            for color in (GRAY, RED):
+                tile = pygame.Surface((button_size, button_size)).convert()
+                tile.fill(color)
+                pygame.draw.rect(tile, WHITE, (0, 0, button_size, button_size), 2)
+                tiles.append(tile)
+            self._button_tiles = tuple(tiles)
+        released_tile, pressed_tile = self._button_tiles
+        
+        # Collect all tiles and labels, then blit each group in one call
+        tile_blits = []
+        label_blits = []
         for i, state in enumerate(button_states):
             row = i // columns
             col = i % columns
@@ -211,10 +448,8 @@ class SteeringWheelUI:
             btn_x = x + col * (button_size + spacing)
             btn_y = y + row * (button_size + spacing)
             
-            # Color based on state
-            color = RED if state else GRAY
-            pygame.draw.rect(self.screen, color, (btn_x, btn_y, button_size, button_size))
-            pygame.draw.rect(self.screen, WHITE, (btn_x, btn_y, button_size, button_size), 2)
+            # Tile based on state
+            tile_blits.append((pressed_tile if state else released_tile, (btn_x, btn_y)))
             
             # Button number or action name
             if self.input_config:
@@ -227,72 +462,149 @@ class SteeringWheelUI:
             else:
                 text = str(i)
             
-            text_surface = self.font_small.render(text, True, WHITE)
+            text_surface = self._render_cached(text, self.font_small, WHITE)
             text_rect = text_surface.get_rect(center=(btn_x + button_size//2, btn_y + button_size//2))
-            self.screen.blit(text_surface, text_rect)
+            label_blits.append((text_surface, text_rect))
+        
+        self.screen.blits(tile_blits, doreturn=False)
+        self.screen.blits(label_blits, doreturn=False)
             
-    def _handle_resize(self):
-        """Handle window resize event and update responsive elements."""
-        self.width, self.height = self.screen.get_size()
-        self._update_fonts()
+    def _build_input_plan(self):
+        """
+        Precompute how each joystick control is reported.
+        
+        Resolves the input config lookups (action name, deadzone, inversion,
+        sensitivity) once per control so that _collect_joystick_data only
+        has to read the device and apply the arithmetic.
+        """
+        num_axes = self.joystick.get_numaxes()
+        num_buttons = self.joystick.get_numbuttons()
+        
+        # Controls without a mapping (or without a config) use generic names;
+        # for axes, no deadzone and unit scale pass the raw value (-1 to 1) through
+        axis_keys = [f'axis_{i}' for i in range(num_axes)]
+        deadzones = [0.0] * num_axes
+        scales = [1.0] * num_axes
+        button_keys = [f'button_{i}' for i in range(num_buttons)]
+        
+        if self.input_config:
+            compiled = self.input_config.compile()
+            for axis_id, action, deadzone, sign, sensitivity in compiled.axes:
+                if 0 <= axis_id < num_axes:
+                    axis_keys[axis_id] = action
+                    deadzones[axis_id] = deadzone
+                    # Inversion and sensitivity fold into a single signed scale
+                    scales[axis_id] = sign * sensitivity
+            for button_id, action in compiled.buttons:
+                if 0 <= button_id < num_buttons:
+                    button_keys[button_id] = action
+        
+        num_hats = self.joystick.get_numhats()
+        hat_keys = [f'hat_{i}' for i in range(num_hats)]
+        
+        self._axis_processor = AxisProcessor(axis_keys, deadzones, scales)
+        self._input_keys = tuple(axis_keys + button_keys + hat_keys)
+        self._button_ids = range(num_buttons)
+        self._hat_ids = range(num_hats)
+        self._button_keys = tuple(button_keys)
+        self._hat_keys = tuple(hat_keys)
+        self._raw_data = None
+    
+    def _mark_dirty(self, event):
+        """
+        Record the control a joystick event reports a change of, so the next
+        poll reads it again.
+        
+        Args:
+            event: JOYAXISMOTION, JOYBUTTONDOWN, JOYBUTTONUP or JOYHATMOTION event
+        """
+        if event.instance_id != self._joystick_id:
+            return
+        with self._dirty_lock:
+            if event.type == pygame.JOYAXISMOTION:
+                self._dirty_axes |= 1 << event.axis
+            elif event.type == pygame.JOYHATMOTION:
+                self._dirty_hats |= 1 << event.hat
+            else:
+                self._dirty_buttons |= 1 << event.button
     
     def _collect_joystick_data(self) -> dict:
         """
         Collect current joystick state and return as processed data dictionary.
         
+        The first call reads every control; later calls only read the controls
+        marked by _mark_dirty, and return the previous dict when none was.
+        
         Returns:
             Dictionary with control data ready to send to output drivers
+            (possibly the one returned last time, so it must not be modified)
         """
-        data = {}
-        
-        # Collect axis data
-        for i in range(self.joystick.get_numaxes()):
-            axis_value = self.joystick.get_axis(i)
+        if self._axis_processor is None:
+            self._build_input_plan()
+        
+        with self._dirty_lock:
+            dirty_axes, dirty_buttons, dirty_hats = self._dirty_axes, self._dirty_buttons, self._dirty_hats
+            self._dirty_axes = self._dirty_buttons = self._dirty_hats = 0
+        
+        joystick = self.joystick
+        processor = self._axis_processor
+        data = self._raw_data
+        
+        if data is None:
+            # Collect axis data, applying the same processing as
+            # InputConfig.apply_axis_processing (deadzone, inversion, sensitivity)
+            # to all axes in one batch
+            axis_values = processor.process(map(joystick.get_axis, processor.ids))
             
-            if self.input_config:
-                action = self.input_config.get_action_for_axis(i)
-                if action:
-                    # Apply axis processing (deadzone, inversion, sensitivity)
-                    processed_value = self.input_config.apply_axis_processing(action, axis_value)
-                    data[action] = processed_value
-                else:
-                    # No mapping found for this axis, use generic name
-                    data[f'axis_{i}'] = axis_value
-            else:
-                # Use generic names if no config
-                data[f'axis_{i}'] = axis_value
-        
-        # Collect button data
-        for i in range(self.joystick.get_numbuttons()):
-            button_state = self.joystick.get_button(i)
+            # Pair all values with their keys in plan order: axes, then button and hat/D-pad data
+            data = dict(zip(self._input_keys, chain(
+                axis_values,
+                map(joystick.get_button, self._button_ids),
+                map(joystick.get_hat, self._hat_ids),
+            )))
+        elif dirty_axes or dirty_buttons or dirty_hats:
+            # Update a copy: the previous dict may be in a published snapshot
+            data = dict(data)
+            if dirty_axes:
+                # Axes are processed in one batch, so any moved axis reprocesses them all
+                data.update(zip(processor.keys, processor.process(map(joystick.get_axis, processor.ids))))
             
-            if self.input_config:
-                action = self.input_config.get_action_for_button(i)
-                if action:
-                    data[action] = button_state
-                else:
-                    # No mapping found for this button, use generic name
-                    data[f'button_{i}'] = button_state
-            else:
-                # Use generic names if no config
-                data[f'button_{i}'] = button_state
-        
-        # Collect hat/D-pad data
-        for i in range(self.joystick.get_numhats()):
-            hat_value = self.joystick.get_hat(i)
-            data[f'hat_{i}'] = hat_value
-        
+            # Read each set bit, lowest first (IDs beyond the device's controls are dropped)
+            keys = self._button_keys
+            dirty_buttons &= (1 << len(keys)) - 1
+            while dirty_buttons:
+                bit = dirty_buttons & -dirty_buttons
+                button_id = bit.bit_length() - 1
+                data[keys[button_id]] = joystick.get_button(button_id)
+                dirty_buttons ^= bit
+            keys = self._hat_keys
+            dirty_hats &= (1 << len(keys)) - 1
+            while dirty_hats:
+                bit = dirty_hats & -dirty_hats
+                hat_id = bit.bit_length() - 1
+                data[keys[hat_id]] = joystick.get_hat(hat_id)
+                dirty_hats ^= bit
+        
+        self._raw_data = data
         return data
     
-    def _send_joystick_data(self):
-        """Send collected joystick data to output manager if available."""
+    def _poll_input(self):
+        """
+        Collect joystick data, run the driving mode and send the result to the outputs.
+        
+        Returns:
+            Snapshot dict with 'data' (raw mapped input), 'processed' (as sent to
+            outputs) and 'telemetry' (driving mode telemetry), none modified afterwards
+        """
         # Collect raw input data
-        data = self._collect_joystick_data()
+        raw_data = self._collect_joystick_data()
+        data = raw_data
+        telemetry = {'speed': 0, 'gear': 0, 'power': 0, 'mode': 'N/A'}
         
         # Process through driving mode if available
         if self.driving_mode:
             # Update driving mode physics
-            current_time = time.time()
+            current_time = time.perf_counter()
             delta_time = current_time - self.last_time
             self.last_time = current_time
             
@@ -300,11 +612,65 @@ class SteeringWheelUI:
             
             # Process input through driving mode
             data = self.driving_mode.process_input(data)
+            telemetry = self.driving_mode.get_telemetry()
+        
+        # Modes return a new dict or their (never mutated) input, so it can be
+        # published as is
+        processed = data
+        self._send_joystick_data(processed)
+        
+        return {'data': raw_data, 'processed': processed, 'telemetry': telemetry}
+    
+    def _input_loop(self):
+        """
+        Poll input and publish snapshots at INPUT_RATE (runs in the input thread).
+        
+        Reading the joystick here while the main thread pumps SDL events is
+        intended: get_axis/get_button/get_hat only read the state SDL keeps
+        for the device, which it locks internally.
+        
+        An exception ends the loop; it is logged and shown in the message log,
+        and the main loop stops when it finds this thread dead.
+        """
+        period = 1.0 / INPUT_RATE
+        next_poll = time.perf_counter()
+        try:
+            while self.running:
+                self._telemetry_snapshot = self._poll_input()
+                
+                next_poll += period
+                delay = next_poll - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Running late: don't try to catch up with a burst of polls
+                    next_poll = time.perf_counter()
+        except Exception as e:
+            logger.exception("Input thread stopped")
+            self._add_message(f"Input error: {str(e)[:30]}", RED)
+    
+    def _send_joystick_data(self, data):
+        """
+        Send joystick data to output manager if available.
+        
+        Data equal to the last data sent is skipped, except every
+        OUTPUT_KEEPALIVE seconds so the receiver keeps hearing from us,
+        and while the output reports an error (the last send may have failed
+        on the sender thread after send_data() queued it).
         
+        Args:
+            data: Control data, not modified afterwards
+        """
         # Send to output manager
         if self.output_manager and self.output_manager.driver.connected:
+            now = time.perf_counter()
+            if data == self._last_sent and now - self._last_send_time < OUTPUT_KEEPALIVE:
+                if not self.output_manager.get_status().get('error'):
+                    return
             try:
-                self.output_manager.send_data(data)
+                if self.output_manager.send_data(data):
+                    self._last_sent = data
+                    self._last_send_time = now
             except Exception as e:
                 self._add_message(f"Error sending data: {str(e)[:30]}", RED)
         
@@ -312,6 +678,11 @@ class SteeringWheelUI:
         """Handle window resize event and update responsive elements."""
         self.width, self.height = self.screen.get_size()
         self._update_fonts()
+        self._update_overlay_layout()
+        self._bg_cache.clear()
+        self._panel_cache.clear()
+        self._button_tiles = None
+        self._composite = None
         
     def _draw_no_device_screen(self):
         """Draw error screen when no device is connected."""
@@ -331,18 +702,70 @@ class SteeringWheelUI:
         pygame.display.flip()
         pygame.time.wait(3000)
         
+    def _draw_panel_background(self, name, x, y, width, height, alpha, draw_static=None,
+                               fill_color=DARK_GRAY, border_width=3):
+        """
+        Draw the static layers of a panel, rendering them on first use.
+        
+        The translucent fill is a display-format surface blitted with surface
+        alpha; the border and whatever `draw_static` draws (in panel-local
+        coordinates, shapes only) live on a colorkeyed layer blitted on top.
+        Both are kept until the next resize.
+        
+        Args:
+            name: Panel name (cache key)
+            x, y: Panel position on screen
+            width, height: Panel dimensions
+            alpha: Opacity of the panel fill (0-255)
+            draw_static: Optional function(surface, width, height) drawing static shapes
+            fill_color: Color of the panel fill
+            border_width: Width of the blue border
+        """
+        key = (name, width, height)
+        layers = self._bg_cache.get(key)
+        if layers is None:
+            fill = pygame.Surface((width, height)).convert()
+            fill.fill(fill_color)
+            fill.set_alpha(alpha)
+            
+            decorations = pygame.Surface((width, height)).convert()
+            decorations.fill(PANEL_COLORKEY)
+            decorations.set_colorkey(PANEL_COLORKEY, pygame.RLEACCEL)
+            pygame.draw.rect(decorations, BLUE, (0, 0, width, height), border_width)
+            if draw_static:
+                draw_static(decorations, width, height)
+            
+            layers = self._bg_cache[key] = (fill, decorations)
+        
+        self.screen.blit(layers[0], (x, y))
+        self.screen.blit(layers[1], (x, y))
+    
     def _draw_interface(self):
-        """Draw the main interface with all controls."""
-        # Clear screen
-        self.screen.fill(BLACK)
+        """
+        Draw the main interface with all controls.
         
-        # Calculate responsive dimensions
-        margin = int(self.width * 0.01)  # Reduced from 0.02
+        Only the areas that can change are redrawn: the static parts live in
+        a screen composite and are restored from it.
         
-        # Get telemetry data from driving mode
-        telemetry = self.driving_mode.get_telemetry() if self.driving_mode else {
-            'speed': 0, 'gear': 0, 'power': 0, 'mode': 'N/A'
-        }
+        Returns:
+            List of screen rectangles that changed (for pygame.display.update)
+        """
+        # Get telemetry data from driving mode (published by the input thread)
+        telemetry = self._frame_telemetry
+        
+        dirty = []
+        if self._composite is None:
+            # First frame or resized: rebuild the static layers and show all of it
+            self._build_composite(telemetry)
+            self._stream_drawn_seq = -1
+            dirty.append(self.screen.get_rect())
+        
+        # Restore the band holding the bottom panels (including labels that
+        # overflow them) from the composite
+        band_top = min(rect[1] for rect in self._panel_rects().values())
+        band = pygame.Rect(0, band_top, self.width, self.height - band_top)
+        self.screen.blit(self._composite, band, band)
+        dirty.append(band)
         
         # === CENTRAL BOTTOM PANEL - Tachometers and Gear ===
         self._draw_central_panel(telemetry)
@@ -355,7 +778,37 @@ class SteeringWheelUI:
         
         # === CENTER AREA - MJPEG Stream (if configured) ===
         if self.stream_url:
-            self._draw_stream_video()
+            video_rect = self._video_rect()
+            if video_rect.colliderect(band):
+                # The band restore covered part of the video; draw it again
+                self._stream_drawn_seq = -1
+            if self._draw_stream_video():
+                # The title is drawn over the video
+                self._draw_title(telemetry)
+                dirty.append(video_rect)
+        
+        return dirty
+    
+    def _build_composite(self, telemetry):
+        """Draw the static layers of the interface and keep a copy as the screen composite."""
+        self.screen.fill(BLACK)
+        
+        rects = self._panel_rects()
+        self._draw_panel_background('central', *rects['central'], 200, self._draw_central_panel_static)
+        self._draw_panel_background('position', *rects['position'], 200, self._draw_position_indicator_static)
+        self._draw_panel_background('output', *rects['output'], 220)
+        
+        # Steering panel title
+        panel_x, panel_y = rects['position'][:2]
+        self._draw_text("STEERING", (panel_x + 10, panel_y + 10), self.font_small, CYAN)
+        
+        self._draw_title(telemetry)
+        self._composite = self.screen.copy()
+    
+    def _draw_title(self, telemetry):
+        """Draw the title and config info at the top of the screen."""
+        # Calculate responsive dimensions
+        margin = int(self.width * 0.01)  # Reduced from 0.02
         
         # === TOP - Title and Config Info ===
         self._draw_text(
@@ -370,33 +823,50 @@ class SteeringWheelUI:
         if self.input_config:
             config_text += f" | Config: {self.input_config.name}"
         self._draw_text(config_text, (margin, config_y), self.font_small, LIGHT_GRAY)
+    
+    def _panel_rects(self):
+        """
+        Compute the screen rectangles of the bottom panels.
+        
+        Returns:
+            Dictionary of panel name ('central', 'position', 'output') to (x, y, width, height)
+        """
+        # Panel dimensions - reduced size
+        bottom_margin = int(self.height * 0.01)  # Reduced margin
+        
+        central_width = int(self.width * 0.35)  # Reduced from 0.45
+        central_height = int(self.height * 0.25)  # Reduced from 0.35
+        
+        position_width = int(self.width * 0.15)  # Reduced from 0.2
+        position_height = int(self.height * 0.2)  # Reduced from 0.25
         
+        output_width = int(self.width * 0.2)  # Reduced from 0.25
+        output_height = int(self.height * 0.25)  # Reduced from 0.35
+        
+        return {
+            'central': ((self.width - central_width) // 2, self.height - central_height - bottom_margin,
+                        central_width, central_height),
+            'position': (int(self.width * 0.01), self.height - position_height - bottom_margin,
+                         position_width, position_height),
+            'output': (self.width - output_width - int(self.width * 0.01), self.height - output_height - bottom_margin,
+                       output_width, output_height),
+        }
+    
     def _draw_central_panel(self, telemetry):
         """Draw central panel with tachometers and gear indicator."""
-        # Panel dimensions - reduced size
-        panel_width = int(self.width * 0.35)  # Reduced from 0.45
-        panel_height = int(self.height * 0.25)  # Reduced from 0.35
-        panel_x = (self.width - panel_width) // 2
-        panel_y = self.height - panel_height - int(self.height * 0.01)  # Reduced margin
-        
-        # Draw panel background
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(200)
-        panel_surface.fill(DARK_GRAY)
-        self.screen.blit(panel_surface, (panel_x, panel_y))
-        pygame.draw.rect(self.screen, BLUE, (panel_x, panel_y, panel_width, panel_height), 3)
+        # Panel background and gauge backgrounds are part of the screen composite
+        panel_x, panel_y, panel_width, panel_height = self._panel_rects()['central']
         
         # Tachometer dimensions - reduced size
-        tach_radius = int(panel_height * 0.3)  # Reduced from 0.35
-        tach_y = panel_y + panel_height // 2
+        tach_radius, tach_offset_y, speed_bar_rect = self._central_panel_layout(panel_width, panel_height)
+        tach_y = panel_y + tach_offset_y
         
         # Left tachometer - BRAKE
         left_tach_x = panel_x + panel_width // 4
-        # Get brake value from joystick
+        # Get brake value from this frame's joystick data
         brake_value = 0.0
-        if self.joystick:
-            data = self._collect_joystick_data()
-            brake_raw = data.get('brake', 0.0)
+        if self._frame_data is not None:
+            brake_raw = self._frame_data.get('brake', 0.0)
             brake_value = ((brake_raw + 1.0) / 2.0) * 100.0  # Convert -1,1 to 0-100%
         
         self._draw_tachometer(
@@ -419,23 +889,45 @@ class SteeringWheelUI:
         self._draw_gear_indicator(gear_x, gear_y, telemetry['gear'], int(tach_radius * 0.8))
         
         # Speed bar at top of panel
+        speed_bar_x, speed_bar_y, speed_bar_width, speed_bar_height = speed_bar_rect
+        self._draw_speed_bar(
+            panel_x + speed_bar_x, panel_y + speed_bar_y,
+            speed_bar_width, speed_bar_height, telemetry['speed']
+        )
+    
+    def _central_panel_layout(self, panel_width, panel_height):
+        """
+        Compute the central panel geometry, relative to the panel.
+        
+        Returns:
+            Tuple of (tachometer radius, tachometer center y, speed bar rect)
+        """
+        tach_radius = int(panel_height * 0.3)  # Reduced from 0.35
         speed_bar_width = int(panel_width * 0.8)
         speed_bar_height = int(panel_height * 0.08)
-        speed_bar_x = panel_x + (panel_width - speed_bar_width) // 2
-        speed_bar_y = panel_y + int(panel_height * 0.05)
-        self._draw_speed_bar(speed_bar_x, speed_bar_y, speed_bar_width, speed_bar_height, telemetry['speed'])
+        speed_bar_rect = (
+            (panel_width - speed_bar_width) // 2, int(panel_height * 0.05),
+            speed_bar_width, speed_bar_height
+        )
+        return tach_radius, panel_height // 2, speed_bar_rect
+    
+    def _draw_central_panel_static(self, surface, panel_width, panel_height):
+        """Draw the static parts of the central panel (gauge backgrounds) on `surface`."""
+        tach_radius, tach_y, speed_bar_rect = self._central_panel_layout(panel_width, panel_height)
+        for tach_x in (panel_width // 4, (3 * panel_width) // 4):
+            # Outer circle and background arc of each tachometer
+            pygame.draw.circle(surface, GRAY, (tach_x, tach_y), tach_radius, 3)
+            self._draw_arc(tach_x, tach_y, tach_radius - 10, TACH_START_ANGLE, TACH_END_ANGLE,
+                           DARK_GRAY, 8, surface)
+        
+        # Speed bar background and border
+        pygame.draw.rect(surface, DARK_GRAY, speed_bar_rect)
+        pygame.draw.rect(surface, WHITE, speed_bar_rect, 2)
     
     def _draw_tachometer(self, x, y, radius, value, min_val, max_val, label, unit, color):
-        """Draw a circular tachometer gauge."""
-        # Draw outer circle
-        pygame.draw.circle(self.screen, GRAY, (x, y), radius, 3)
-        
-        # Draw arc for the gauge
-        start_angle = math.pi * 0.75  # 135 degrees
-        end_angle = math.pi * 2.25    # 405 degrees (270 degree sweep)
-        
-        # Draw background arc
-        self._draw_arc(x, y, radius - 10, start_angle, end_angle, DARK_GRAY, 8)
+        """Draw a circular tachometer gauge (outer circle and background arc are cached)."""
+        start_angle = TACH_START_ANGLE
+        end_angle = TACH_END_ANGLE
         
         # Calculate value angle
         value_clamped = max(min_val, min(value, max_val))
@@ -451,34 +943,39 @@ class SteeringWheelUI:
         
         # Draw value text
         value_text = f"{int(value)}"
-        value_surface = self.font_large.render(value_text, True, WHITE)
+        value_surface = self._render_cached(value_text, self.font_large, WHITE)
         value_rect = value_surface.get_rect(center=(x, y - int(radius * 0.1)))
         self.screen.blit(value_surface, value_rect)
         
         # Draw unit
-        unit_surface = self.font_small.render(unit, True, LIGHT_GRAY)
+        unit_surface = self._render_cached(unit, self.font_small, LIGHT_GRAY)
         unit_rect = unit_surface.get_rect(center=(x, y + int(radius * 0.15)))
         self.screen.blit(unit_surface, unit_rect)
         
         # Draw label below
-        label_surface = self.font_small.render(label, True, color)
+        label_surface = self._render_cached(label, self.font_small, color)
         label_rect = label_surface.get_rect(center=(x, y + radius + 20))
         self.screen.blit(label_surface, label_rect)
     
-    def _draw_arc(self, x, y, radius, start_angle, end_angle, color, width):
-        """Draw an arc (part of a circle)."""
-        # Create a list of points along the arc
-        points = []
-        steps = 50
-        for i in range(steps + 1):
-            angle = start_angle + (end_angle - start_angle) * (i / steps)
-            px = x + radius * math.cos(angle)
-            py = y + radius * math.sin(angle)
-            points.append((px, py))
+    def _draw_arc(self, x, y, radius, start_angle, end_angle, color, width, surface=None):
+        """Draw an arc (part of a circle) on the screen (or on `surface` if given)."""
+        # Indices of the unit circle samples strictly between the two angles,
+        # walking in the direction of the arc
+        if end_angle >= start_angle:
+            indices = range(math.floor(start_angle / ARC_STEP) + 1, math.ceil(end_angle / ARC_STEP))
+        else:
+            indices = range(math.ceil(start_angle / ARC_STEP) - 1, math.floor(end_angle / ARC_STEP), -1)
+        
+        # Create a list of points along the arc: exact endpoints, table samples in between
+        points = [(x + radius * math.cos(start_angle), y + radius * math.sin(start_angle))]
+        for i in indices:
+            cos_a, sin_a = UNIT_CIRCLE[i % ARC_SEGMENTS]
+            points.append((x + radius * cos_a, y + radius * sin_a))
+        points.append((x + radius * math.cos(end_angle), y + radius * math.sin(end_angle)))
         
         # Draw the arc as a series of lines
         if len(points) > 1:
-            pygame.draw.lines(self.screen, color, False, points, width)
+            pygame.draw.lines(self.screen if surface is None else surface, color, False, points, width)
     
     def _draw_gear_indicator(self, x, y, gear, size):
         """Draw gear indicator in the center."""
@@ -502,38 +999,23 @@ class SteeringWheelUI:
             gear_color = GREEN
         
         # Draw gear number
-        gear_font = pygame.font.Font(None, int(size * 1.2))
-        gear_surface = gear_font.render(gear_text, True, gear_color)
+        gear_surface = self._render_cached(gear_text, self._get_font(int(size * 1.2)), gear_color)
         gear_rect = gear_surface.get_rect(center=(x, y))
         self.screen.blit(gear_surface, gear_rect)
         
         # Draw "GEAR" label
-        label_surface = self.font_small.render("GEAR", True, LIGHT_GRAY)
+        label_surface = self._render_cached("GEAR", self.font_small, LIGHT_GRAY)
         label_rect = label_surface.get_rect(center=(x, y + size + 15))
         self.screen.blit(label_surface, label_rect)
     
     def _draw_speed_bar(self, x, y, width, height, speed_percent):
-        """Draw Speed % bar indicator."""
-        # Draw background
-        pygame.draw.rect(self.screen, DARK_GRAY, (x, y, width, height))
-        pygame.draw.rect(self.screen, WHITE, (x, y, width, height), 2)
-        
+        """Draw Speed % bar indicator (background and border are cached)."""
         # Draw speed fill
         speed_ratio = min(abs(speed_percent) / 100.0, 1.0)
         fill_width = int(width * speed_ratio)
         
-        # Color gradient from green (0%) to red (100%)
-        # Calculate RGB values for smooth transition
-        if speed_ratio < 0.5:
-            # Green to Yellow (0-50%)
-            red_val = int(255 * (speed_ratio * 2))
-            green_val = 255
-        else:
-            # Yellow to Red (50-100%)
-            red_val = 255
-            green_val = int(255 * (2 - speed_ratio * 2))
-        
-        speed_color = (red_val, green_val, 0)
+        # Color gradient from green (0%) to red (100%), precomputed per percent
+        speed_color = SPEED_COLORS[int(speed_ratio * 100)]
         
         if fill_width > 0:
             pygame.draw.rect(self.screen, speed_color, (x, y, fill_width, height))
@@ -544,74 +1026,32 @@ class SteeringWheelUI:
     
     def _draw_position_indicator(self):
         """Draw car position and inclination indicator (left bottom)."""
-        # Panel dimensions - reduced size
-        panel_width = int(self.width * 0.15)  # Reduced from 0.2
-        panel_height = int(self.height * 0.2)  # Reduced from 0.25
-        panel_x = int(self.width * 0.01)  # Reduced margin
-        panel_y = self.height - panel_height - int(self.height * 0.01)  # Reduced margin
-        
-        # Draw panel background
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(200)
-        panel_surface.fill(DARK_GRAY)
-        self.screen.blit(panel_surface, (panel_x, panel_y))
-        pygame.draw.rect(self.screen, BLUE, (panel_x, panel_y, panel_width, panel_height), 3)
-        
-        # Draw title
-        self._draw_text("STEERING", (panel_x + 10, panel_y + 10), self.font_small, CYAN)
+        # Panel background, title and dial are part of the screen composite
+        panel_x, panel_y, panel_width, panel_height = self._panel_rects()['position']
         
-        # Get steering angle
+        # Get steering angle from this frame's joystick data
         steering_angle = 0.0
-        if self.joystick:
+        if self._frame_data is not None:
             if self.input_config:
-                action = 'steering'
-                axis_mapping = self.input_config.get_axis_mapping(action)
-                if axis_mapping:
-                    axis_id = axis_mapping.get('axis_id')
-                    if axis_id is not None:
-                        raw_value = self.joystick.get_axis(axis_id)
-                        steering_angle = self.input_config.apply_axis_processing(action, raw_value)
+                steering_angle = self._frame_data.get('steering', 0.0)
             else:
                 # Default to axis 0
-                steering_angle = self.joystick.get_axis(0)
+                steering_angle = self._frame_data.get('axis_0', 0.0)
         
         # Convert steering to angle (-1 to 1 -> -90 to 90 degrees for display)
         angle_deg = steering_angle * 90
         
-        # Draw circular steering indicator
+        # Circular steering indicator (dial is part of the cached background)
         center_x = panel_x + panel_width // 2
         center_y = panel_y + int(panel_height * 0.55)
         indicator_radius = int(min(panel_width, panel_height) * 0.25)  # Reduced from 0.28
         
-        # Draw outer circle (gauge background)
-        pygame.draw.circle(self.screen, DARK_GRAY, (center_x, center_y), indicator_radius)
-        pygame.draw.circle(self.screen, LIGHT_GRAY, (center_x, center_y), indicator_radius, 3)
-        
-        # Draw tick marks for reference angles
-        tick_angles = [-90, -45, 0, 45, 90]
-        for tick_angle in tick_angles:
-            angle_rad = math.radians(tick_angle - 90)  # -90 to start from top
-            # Outer tick
-            outer_x = center_x + (indicator_radius - 5) * math.cos(angle_rad)
-            outer_y = center_y + (indicator_radius - 5) * math.sin(angle_rad)
-            # Inner tick
-            inner_x = center_x + (indicator_radius - 15) * math.cos(angle_rad)
-            inner_y = center_y + (indicator_radius - 15) * math.sin(angle_rad)
-            
-            tick_color = CYAN if tick_angle == 0 else GRAY
-            tick_width = 3 if tick_angle == 0 else 1
-            pygame.draw.line(self.screen, tick_color, (outer_x, outer_y), (inner_x, inner_y), tick_width)
-        
-        # Draw steering range arc (from -90 to +90)
-        start_angle = math.pi  # 180 degrees (left)
-        end_angle = 0  # 0 degrees (right)
-        self._draw_arc(center_x, center_y, indicator_radius - 8, start_angle, end_angle, BLUE, 2)
-        
         # Draw current steering indicator (needle)
-        angle_rad = math.radians(angle_deg - 90)  # -90 to start from top
         needle_length = indicator_radius - 20
-        needle_end_x = center_x + needle_length * math.cos(angle_rad)
-        needle_end_y = center_y + needle_length * math.sin(angle_rad)
+        needle = pygame.math.Vector2()
+        needle.from_polar((needle_length, angle_deg - 90))  # -90 to start from top
+        needle_end_x = center_x + needle.x
+        needle_end_y = center_y + needle.y
         
         # Draw needle
         pygame.draw.line(self.screen, YELLOW, (center_x, center_y), 
@@ -623,9 +1063,16 @@ class SteeringWheelUI:
         pygame.draw.circle(self.screen, YELLOW, (center_x, center_y), 15, 2)
         
         # Draw angle value in the center
-        angle_text = f"{angle_deg:+.0f}°"
-        angle_font = pygame.font.Font(None, int(indicator_radius * 0.35))
-        angle_surface = angle_font.render(angle_text, True, WHITE)
+        # (the needle follows every frame, the readout refreshes at PANEL_TEXT_RATE)
+        now = time.perf_counter()
+        cached = self._panel_cache.get('position')
+        if cached and now - cached[1] < 1.0 / PANEL_TEXT_RATE:
+            angle_surface = cached[0]
+        else:
+            angle_text = f"{angle_deg:+.0f}°"
+            angle_font = self._get_font(int(indicator_radius * 0.35))
+            angle_surface = self._render_cached(angle_text, angle_font, WHITE)
+            self._panel_cache['position'] = (angle_surface, now)
         angle_rect = angle_surface.get_rect(center=(center_x, center_y))
         self.screen.blit(angle_surface, angle_rect)
         
@@ -633,96 +1080,128 @@ class SteeringWheelUI:
         self._draw_text("Inclination: 0.0°", (panel_x + 10, panel_y + panel_height - 15), 
                        self.font_small, GRAY)
     
+    def _draw_position_indicator_static(self, surface, panel_width, panel_height):
+        """Draw the static parts of the position indicator (the dial) on `surface`."""
+        center_x = panel_width // 2
+        center_y = int(panel_height * 0.55)
+        indicator_radius = int(min(panel_width, panel_height) * 0.25)  # Reduced from 0.28
+        
+        # Draw outer circle (gauge background)
+        pygame.draw.circle(surface, DARK_GRAY, (center_x, center_y), indicator_radius)
+        pygame.draw.circle(surface, LIGHT_GRAY, (center_x, center_y), indicator_radius, 3)
+        
+        # Draw tick marks for reference angles, from outer to inner point
+        outer_radius = indicator_radius - 5
+        inner_radius = indicator_radius - 15
+        for dx, dy, tick_color, tick_width in STEERING_TICKS:
+            pygame.draw.line(surface, tick_color,
+                             (center_x + outer_radius * dx, center_y + outer_radius * dy),
+                             (center_x + inner_radius * dx, center_y + inner_radius * dy),
+                             tick_width)
+        
+        # Draw steering range arc (from -90 to +90)
+        start_angle = math.pi  # 180 degrees (left)
+        end_angle = 0  # 0 degrees (right)
+        self._draw_arc(center_x, center_y, indicator_radius - 8, start_angle, end_angle, BLUE, 2, surface)
+    
     def _draw_output_data_panel(self):
         """Draw output data panel (right bottom)."""
-        # Panel dimensions - reduced size
-        panel_width = int(self.width * 0.2)  # Reduced from 0.25
-        panel_height = int(self.height * 0.25)  # Reduced from 0.35
-        panel_x = self.width - panel_width - int(self.width * 0.01)  # Reduced margin
-        panel_y = self.height - panel_height - int(self.height * 0.01)  # Reduced margin
-        
-        # Draw panel background
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(220)
-        panel_surface.fill(DARK_GRAY)
-        self.screen.blit(panel_surface, (panel_x, panel_y))
-        pygame.draw.rect(self.screen, BLUE, (panel_x, panel_y, panel_width, panel_height), 3)
+        # Panel background is part of the screen composite
+        panel_x, panel_y, panel_width, panel_height = self._panel_rects()['output']
+        
+        # The rest is only text: re-render it at PANEL_TEXT_RATE into a
+        # transparent layer and blit that layer on the frames in between
+        now = time.perf_counter()
+        cached = self._panel_cache.get('output')
+        if cached and now - cached[1] < 1.0 / PANEL_TEXT_RATE:
+            self.screen.blit(cached[0], (panel_x, panel_y))
+            return
+        
+        if cached and cached[0].get_size() == (panel_width, panel_height):
+            panel = cached[0]
+        else:
+            panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA).convert_alpha()
+        panel.fill((0, 0, 0, 0))
         
         # Draw title
-        self._draw_text("OUTPUT DATA", (panel_x + 10, panel_y + 10), self.font_small, CYAN)
+        self._draw_text("OUTPUT DATA", (10, 10), self.font_small, CYAN, panel)
         
-        # Get last joystick data
-        if self.joystick:
-            data = self._collect_joystick_data()
-            
-            # Process through driving mode if available
-            if self.driving_mode:
-                data = self.driving_mode.process_input(data)
-            
-            y_offset = panel_y + 35
+        # Get this frame's processed joystick data
+        data = self._frame_processed
+        if data is not None:
+            y_offset = 35
             line_height = int(panel_height * 0.055)
+            font = self.font_small
+            label_x = 10
+            value_right = panel_width - 10
             
-            # Define which data to display and in what order
-            display_order = [
-                ('steering', 'Steering', CYAN),
-                ('throttle', 'Throttle', GREEN),
-                ('brake', 'Brake', RED),
-                ('clutch', 'Clutch', YELLOW),
-                ('shift_up', 'Shift Up', LIGHT_GRAY),
-                ('shift_down', 'Shift Down', LIGHT_GRAY),
-                ('simulated_speed', 'Speed %', ORANGE),
-                ('simulated_power', 'Power %', ORANGE),
-                ('simulated_gear', 'Gear', PURPLE),
-            ]
-            
-            for key, label, color in display_order:
+            # Rows are collected as (surface, position, area, flags) and drawn
+            # with a single blits() call
+            blit_seq = []
+            for key, label, color, formatter in OUTPUT_PANEL_FIELDS:
                 if key in data:
                     value = data[key]
                     
-                    # Format value based on type
-                    if isinstance(value, float):
-                        if 'simulated' in key:
-                            value_str = f"{value:.1f}"
-                        else:
-                            value_str = f"{value:+.2f}"
-                        # Color based on magnitude
-                        if abs(value) > 0.1:
-                            value_color = color
-                        else:
-                            value_color = GRAY
-                    elif isinstance(value, bool):
-                        value_str = "ON" if value else "off"
-                        value_color = color if value else GRAY
-                    elif isinstance(value, int):
-                        value_str = str(value)
-                        value_color = color
-                    else:
-                        value_str = str(value)
-                        value_color = WHITE
-                    
-                    # Draw label
-                    self._draw_text(f"{label}:", (panel_x + 10, y_offset), self.font_small, LIGHT_GRAY)
+                    # Format value with the formatter for this key, falling back
+                    # to formatting by type if the value isn't of the expected type
+                    try:
+                        value_str, value_color = formatter(value, color)
+                    except (TypeError, ValueError):
+                        value_str, value_color = _format_value(value, color)
                     
-                    # Draw value (right-aligned)
-                    value_surface = self.font_small.render(value_str, True, value_color)
-                    value_x = panel_x + panel_width - value_surface.get_width() - 10
-                    self.screen.blit(value_surface, (value_x, y_offset))
+                    # Label, and value right-aligned
+                    value_surface = self._render_cached(value_str, font, value_color)
+                    blit_seq.append((self._render_cached(label, font, LIGHT_GRAY), (label_x, y_offset),
+                                     None, pygame.BLEND_RGBA_MAX))
+                    blit_seq.append((value_surface, (value_right - value_surface.get_width(), y_offset),
+                                     None, pygame.BLEND_RGBA_MAX))
                     
                     y_offset += line_height
             
+            # Text is copied onto the transparent layer, see _draw_text()
+            panel.blits(blit_seq, doreturn=False)
+            
             # Show output driver status at bottom
-            y_offset = panel_y + panel_height - 40
+            y_offset = panel_height - 40
             if self.output_manager and self.output_manager.driver.connected:
                 driver_name = self.output_manager.driver.__class__.__name__.replace('Driver', '')
-                self._draw_text(f"Output: {driver_name}", (panel_x + 10, y_offset), 
-                               self.font_small, GREEN)
+                self._draw_text(f"Output: {driver_name}", (10, y_offset), 
+                               self.font_small, GREEN, panel)
             else:
-                self._draw_text("Output: Disconnected", (panel_x + 10, y_offset), 
-                               self.font_small, RED)
+                self._draw_text("Output: Disconnected", (10, y_offset), 
+                               self.font_small, RED, panel)
         else:
             # No joystick connected
-            self._draw_text("No device connected", (panel_x + 10, panel_y + 40), 
-                           self.font_small, RED)
+            self._draw_text("No device connected", (10, 40), 
+                           self.font_small, RED, panel)
+        
+        self._panel_cache['output'] = (panel, now)
+        self.screen.blit(panel, (panel_x, panel_y))
+    
+    def _update_overlay_layout(self):
+        """Compute the debug overlay positions and spacing for the current screen size."""
+        overlay_width = int(self.width * 0.45)
+        overlay_height = int(self.height * 0.9)
+        overlay_x = self.width - overlay_width - int(self.width * 0.02)
+        overlay_y = int(self.height * 0.05)
+        title_y = overlay_y + int(self.height * 0.02)
+        row_height = int(self.height * 0.025)
+        self._overlay_layout = {
+            'rect': (overlay_x, overlay_y, overlay_width, overlay_height),
+            'title_y': title_y,
+            'first_y': title_y + int(self.height * 0.05),  # First section header
+            'header_height': int(self.height * 0.03),  # Section header to its first row
+            'section_gap': int(self.height * 0.02),
+            'row_height': row_height,
+            # Rows below this wouldn't fit above the bottom border
+            'rows_bottom': overlay_y + overlay_height - 2 - row_height,
+            'label_x': overlay_x + 10,
+            'key_x': overlay_x + 15,
+            'value_x': overlay_x + overlay_width - 100,
+        }
+        
+        # Text of the last overlay drawn, as (data key, blit list); see _draw_debug_overlay
+        self._overlay_text = None
     
     def _draw_debug_overlay(self):
         """Draw debug data overlay showing all control values."""
@@ -733,26 +1212,41 @@ class SteeringWheelUI:
         if not last_data:
             return
         
-        # Create semi-transparent overlay background
-        overlay_width = int(self.width * 0.45)
-        overlay_height = int(self.height * 0.9)
-        overlay_x = self.width - overlay_width - int(self.width * 0.02)
-        overlay_y = int(self.height * 0.05)
-        
-        # Draw background
-        overlay_surface = pygame.Surface((overlay_width, overlay_height))
-        overlay_surface.set_alpha(230)
-        overlay_surface.fill((20, 20, 30))
-        self.screen.blit(overlay_surface, (overlay_x, overlay_y))
+        layout = self._overlay_layout
+        overlay_x, overlay_y, overlay_width, overlay_height = layout['rect']
+        label_x = layout['label_x']
+        key_x = layout['key_x']
+        value_x = layout['value_x']
+        row_height = layout['row_height']
+        header_height = layout['header_height']
+        rows_bottom = layout['rows_bottom']
+        
+        # Semi-transparent background and border, rendered once per size
+        self._draw_panel_background('overlay', overlay_x, overlay_y, overlay_width, overlay_height, 230,
+                                    fill_color=(20, 20, 30), border_width=2)
+        
+        # The text only changes when a displayed value does (floats are shown
+        # to 3 decimals, highlighted above 0.1); otherwise draw the same text
+        # again without formatting or looking up anything
+        data_key = tuple(
+            (key, round(value, 3), abs(value) > 0.1) if isinstance(value, float) else (key, value)
+            for key, value in last_data.items()
+        )
+        cached = self._overlay_text
+        if cached is not None and cached[0] == data_key:
+            self.screen.blits(cached[1], doreturn=False)
+            return
         
-        # Draw border
-        pygame.draw.rect(self.screen, BLUE, (overlay_x, overlay_y, overlay_width, overlay_height), 2)
+        # Text is collected as (surface, position) and drawn with a single blits() call
+        render = self._render_cached
+        font = self.font_small
+        blit_seq = []
         
         # Title
-        title_y = overlay_y + int(self.height * 0.02)
-        self._draw_text("DEBUG DATA", (overlay_x + 10, title_y), self.font_medium, YELLOW)
+        blit_seq.append((render("DEBUG DATA", self.font_medium, YELLOW), (label_x, layout['title_y'])))
         
-        # Separator
+        # Separator (rows that wouldn't fit above the bottom border are
+        # neither rendered nor drawn)
         mapped_controls = {}
         unmapped_controls = {}
         
@@ -763,12 +1257,14 @@ class SteeringWheelUI:
                 mapped_controls[key] = value
         
         # Draw mapped controls
-        y_pos = title_y + int(self.height * 0.05)
+        y_pos = layout['first_y']
         if mapped_controls:
-            self._draw_text("MAPPED CONTROLS:", (overlay_x + 10, y_pos), self.font_small, GREEN)
-            y_pos += int(self.height * 0.03)
+            blit_seq.append((render("MAPPED CONTROLS:", font, GREEN), (label_x, y_pos)))
+            y_pos += header_height
             
             for key, value in mapped_controls.items():
+                if y_pos > rows_bottom:
+                    break
                 if isinstance(value, float):
                     value_str = f"{value:+.3f}"
                     color = GREEN if abs(value) > 0.1 else LIGHT_GRAY
@@ -779,21 +1275,20 @@ class SteeringWheelUI:
                     value_str = str(value)
                     color = WHITE
                 
-                # Draw key
-                text = f"{key:15s}"
-                self._draw_text(text, (overlay_x + 15, y_pos), self.font_small, LIGHT_GRAY)
-                
-                # Draw value
-                self._draw_text(value_str, (overlay_x + overlay_width - 100, y_pos), self.font_small, color)
-                y_pos += int(self.height * 0.025)
+                # Key and value
+                blit_seq.append((render(f"{key:15s}", font, LIGHT_GRAY), (key_x, y_pos)))
+                blit_seq.append((render(value_str, font, color), (value_x, y_pos)))
+                y_pos += row_height
         
         # Draw unmapped controls
-        if unmapped_controls:
-            y_pos += int(self.height * 0.02)
-            self._draw_text("UNMAPPED:", (overlay_x + 10, y_pos), self.font_small, YELLOW)
-            y_pos += int(self.height * 0.03)
+        if unmapped_controls and y_pos + layout['section_gap'] + header_height <= rows_bottom:
+            y_pos += layout['section_gap']
+            blit_seq.append((render("UNMAPPED:", font, YELLOW), (label_x, y_pos)))
+            y_pos += header_height
             
             for key, value in unmapped_controls.items():
+                if y_pos > rows_bottom:
+                    break
                 if isinstance(value, float):
                     value_str = f"{value:+.3f}"
                     color = YELLOW if abs(value) > 0.1 else LIGHT_GRAY
@@ -804,10 +1299,13 @@ class SteeringWheelUI:
                     value_str = str(value)
                     color = WHITE
                 
-                text = f"{key:12s}"
-                self._draw_text(text, (overlay_x + 15, y_pos), self.font_small, LIGHT_GRAY)
-                self._draw_text(value_str, (overlay_x + overlay_width - 100, y_pos), self.font_small, color)
-                y_pos += int(self.height * 0.025)    
+                blit_seq.append((render(f"{key:12s}", font, LIGHT_GRAY), (key_x, y_pos)))
+                blit_seq.append((render(value_str, font, color), (value_x, y_pos)))
+                y_pos += row_height
+        
+        self._overlay_text = (data_key, blit_seq)
+        self.screen.blits(blit_seq, doreturn=False)
+    
     def set_stream_url(self, stream_url, config_file=None):
         """Configure and start MJPEG stream.
         
@@ -817,11 +1315,11 @@ class SteeringWheelUI:
         """
         self.stream_url = stream_url
         
-        # Load configuration if provided
-        if config_file and os.path.exists(config_file):
+        # Load configuration if provided (a missing file is skipped)
+        if config_file:
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+                with open(config_file, 'rb') as f:
+                    config = loads(f.read())
                     # Update stream_config with loaded values
                     if 'display' in config:
                         self.stream_config['display'].update(config['display'])
@@ -830,6 +1328,8 @@ class SteeringWheelUI:
                     if 'performance' in config:
                         self.stream_config['performance'].update(config['performance'])
                     self._add_message(f"Stream config loaded", GREEN)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 self._add_message(f"Config error: {str(e)[:30]}", YELLOW)
         
@@ -839,60 +1339,303 @@ class SteeringWheelUI:
             self.stream_thread.start()
             self._add_message(f"Stream started", CYAN)
     
+    def _open_stream(self):
+        """
+        Connect to the stream URL, send the GET request and read the response headers.
+        
+        Returns:
+            Tuple of (socket, HTTP status code, headers dict with lowercase names,
+            body bytes received along with the headers)
+        """
+        url = urlsplit(self.stream_url)
+        secure = url.scheme == 'https'
+        port = url.port or (443 if secure else 80)
+        sock = socket.create_connection((url.hostname, port), timeout=5)
+        if secure:
+            import ssl
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=url.hostname)
+        
+        path = url.path or '/'
+        if url.query:
+            path += '?' + url.query
+        host = url.hostname if url.port is None else f"{url.hostname}:{url.port}"
+        request = (
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {host}\r\n"
+            "Accept: multipart/x-mixed-replace, image/jpeg\r\n"
+            "Connection: close\r\n"
+            "\r\n"
+        )
+        sock.sendall(request.encode('ascii'))
+        
+        # Read until the end of the response headers
+        buffer = bytearray()
+        header_end = -1
+        while header_end < 0:
+            chunk = sock.recv(4096)
+            if not chunk:
+                sock.close()
+                raise ConnectionError("Connection closed")
+            buffer += chunk
+            header_end = buffer.find(b'\r\n\r\n')
+        
+        status_line, *header_lines = buffer[:header_end].decode('latin-1').split('\r\n')
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        status = int(status_line.split()[1])
+        
+        return sock, status, headers, bytes(buffer[header_end + 4:])
+    
+    @staticmethod
+    def _iter_body(sock, pending, chunked):
+        """
+        Yield the body of an HTTP response as it arrives.
+        
+        Args:
+            sock: Connected socket, positioned after the response headers
+            pending: Body bytes already received with the headers
+            chunked: True for Transfer-Encoding: chunked (chunk framing is removed)
+            
+        Data is read into one reused buffer, so a yielded value is only valid
+        until the next one is requested.
+        """
+        read_buffer = bytearray(65536)
+        read_view = memoryview(read_buffer)
+        
+        if not chunked:
+            if pending:
+                yield pending
+            while True:
+                read = sock.recv_into(read_buffer)
+                if not read:
+                    return
+                yield read_view[:read]
+        
+        buffer = bytearray(pending)
+        while True:
+            # Chunk size line, then the chunk data and its trailing CRLF
+            line_end = buffer.find(b'\r\n')
+            while line_end < 0:
+                read = sock.recv_into(read_buffer)
+                if not read:
+                    return
+                buffer += read_view[:read]
+                line_end = buffer.find(b'\r\n')
+            size = int(bytes(buffer[:line_end]).split(b';')[0], 16)
+            if size == 0:
+                return
+            chunk_end = line_end + 2 + size
+            while len(buffer) < chunk_end + 2:
+                read = sock.recv_into(read_buffer)
+                if not read:
+                    return
+                buffer += read_view[:read]
+            yield bytes(buffer[line_end + 2:chunk_end])
+            del buffer[:chunk_end + 2]
+    
+    @staticmethod
+    def _part_content_length(buffer, start, end):
+        """
+        Get the Content-Length of a multipart part from its headers.
+        
+        Args:
+            buffer: Stream buffer
+            start, end: Offsets of the part headers (delimiter line included)
+            
+        Returns:
+            Body length in bytes, or None if the part doesn't declare it
+        """
+        for line in bytes(buffer[start:end]).split(b'\r\n'):
+            name, _, value = line.partition(b':')
+            if name.strip().lower() == b'content-length':
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
+    
     def _stream_reader(self):
         """Read MJPEG stream in background thread."""
         try:
-            response = requests.get(self.stream_url, stream=True, timeout=5)
-            if response.status_code != 200:
-                self._add_message(f"Stream error: {response.status_code}", RED)
-                return
-            
-            boundary = None
-            buffer = b''
-            
-            for chunk in response.iter_content(chunk_size=1024):
-                if not self.stream_running:
-                    break
+            sock, status, headers, pending = self._open_stream()
+            with sock:
+                if status != 200:
+                    self._add_message(f"Stream error: {status}", RED)
+                    return
+                
+                # Part delimiter from the multipart Content-Type, else found in the body
+                delimiter = None
+                content_type = headers.get('content-type', '')
+                if 'boundary=' in content_type:
+                    boundary = content_type.split('boundary=', 1)[1].split(';')[0].strip().strip('"')
+                    delimiter = b'--' + boundary.lstrip('-').encode('latin-1')
                 
-                buffer += chunk
+                chunked = 'chunked' in headers.get('transfer-encoding', '').lower()
                 
-                # Find boundary
-                if boundary is None:
-                    if b'--' in buffer:
-                        idx = buffer.find(b'\r\n')
-                        if idx > 0:
-                            boundary = buffer[:idx]
-                            buffer = buffer[idx+2:]
+                # Parser state, as offsets into buffer: the current part's delimiter
+                # and body (-1 until found; body_end stays -1 without Content-Length),
+                # and where to resume searching so data is never scanned twice
+                buffer = bytearray()
+                part_start = body_start = body_end = -1
+                scan_from = 0
                 
-                if boundary:
-                    # Find frame boundaries
-                    parts = buffer.split(boundary)
-                    for part in parts[:-1]:
-                        # Extract JPEG data
-                        if b'\xff\xd8\xff' in part:  # JPEG start marker
-                            jpeg_start = part.find(b'\xff\xd8\xff')
-                            jpeg_end = part.find(b'\xff\xd9', jpeg_start) + 2
-                            if jpeg_end > jpeg_start:
-                                try:
-                                    img = Image.open(BytesIO(part[jpeg_start:jpeg_end]))
-                                    
-                                    # Apply configured transformations
-                                    img = self._apply_image_transforms(img)
-                                    
-                                    # Convert to pygame surface
-                                    img_str = pygame.image.fromstring(
-                                        img.tobytes(), img.size, img.mode
-                                    )
-                                    with self.frame_lock:
-                                        self.current_frame = img_str
-                                except Exception as e:
-                                    pass  # Skip bad frames
+                for data in self._iter_body(sock, pending, chunked):
+                    if not self.stream_running:
+                        break
+                    
+                    buffer += data
+                    
+                    # Find boundary
+                    if delimiter is None:
+                        start = buffer.find(b'--')
+                        line_end = buffer.find(b'\r\n', start)
+                        if start < 0 or line_end < 0:
+                            continue
+                        delimiter = bytes(buffer[start:line_end])
+                    
+                    # Walk every part completed by this data; only the newest one
+                    # is decoded, older ones are stale already
+                    newest = None
+                    while True:
+                        if part_start < 0:
+                            part_start = buffer.find(delimiter, scan_from)
+                            if part_start < 0:
+                                scan_from = max(len(buffer) - len(delimiter), scan_from)
+                                break
+                            scan_from = part_start + len(delimiter)
+                        
+                        if body_start < 0:
+                            header_end = buffer.find(b'\r\n\r\n', scan_from)
+                            if header_end < 0:
+                                scan_from = max(len(buffer) - 3, scan_from)
+                                break
+                            body_start = scan_from = header_end + 4
+                            length = self._part_content_length(buffer, part_start, header_end)
+                            if length is not None:
+                                body_end = body_start + length
+                        
+                        if body_end >= 0:
+                            # Length known: wait for the body without scanning it
+                            if len(buffer) < body_end:
+                                break
+                            newest = (body_start, body_end, True)
+                            scan_from = body_end
+                        else:
+                            part_end = buffer.find(delimiter, scan_from)
+                            if part_end < 0:
+                                scan_from = max(len(buffer) - len(delimiter), scan_from)
+                                break
+                            newest = (body_start, part_end, False)
+                            scan_from = part_end
+                        part_start = body_start = body_end = -1
+                    
+                    if newest is not None and not self._frame_consumed.is_set():
+                        # The UI hasn't drawn the last frame yet: decoding this
+                        # one would be wasted, drop it (the next one replaces it)
+                        newest = None
+                    
+                    if newest is not None:
+                        start, end, exact = newest
+                        if not exact:
+                            # Extract JPEG data (start marker to the last end marker)
+                            jpeg_start = buffer.find(b'\xff\xd8\xff', start, end)
+                            jpeg_end = buffer.rfind(b'\xff\xd9', start, end) + 2
+                            start, end = jpeg_start, jpeg_end
+                        jpeg = None
+                        if 0 <= start < end:
+                            with memoryview(buffer) as view:
+                                jpeg = bytes(view[start:end])
+                    
+                    # Drop everything before the part being parsed
+                    cut = part_start if part_start >= 0 else scan_from
+                    if cut:
+                        del buffer[:cut]
+                        scan_from -= cut
+                        if part_start >= 0:
+                            part_start -= cut
+                        if body_start >= 0:
+                            body_start -= cut
+                        if body_end >= 0:
+                            body_end -= cut
                     
-                    buffer = parts[-1]
+                    if newest is not None and jpeg is not None:
+                        try:
+                            self._publish_frame(self._decode_frame(jpeg))
+                        except Exception as e:
+                            pass  # Skip bad frames
         except Exception as e:
             self._add_message(f"Stream error: {str(e)[:30]}", RED)
             self.stream_running = False
     
+    def _decode_frame(self, jpeg):
+        """
+        Decode a JPEG frame and apply the configured transformations.
+        
+        Args:
+            jpeg: JPEG file data
+            
+        Returns:
+            pygame Surface with the frame
+        """
+        display_cfg = self.stream_config.get('display', {})
+        if (display_cfg.get('brightness', 1.0) == 1.0 and display_cfg.get('contrast', 1.0) == 1.0
+                and display_cfg.get('saturation', 1.0) == 1.0):
+            # No color adjustments: let pygame decode it and flip/rotate the
+            # surface directly (a single copy per transform, no PIL round trip)
+            frame = pygame.image.load(BytesIO(jpeg), 'frame.jpg')
+            flip_h = display_cfg.get('flip_horizontal', False)
+            flip_v = display_cfg.get('flip_vertical', False)
+            if flip_h or flip_v:
+                frame = pygame.transform.flip(frame, flip_h, flip_v)
+            rotation = display_cfg.get('rotation', 0)
+            if rotation in (90, 180, 270):
+                # Rotation is clockwise, pygame rotates counterclockwise
+                frame = pygame.transform.rotate(frame, -rotation)
+            return frame
+        
+        # PIL is only needed to adjust frames, so it isn't imported at startup
+        from PIL import Image
+        
+        img = Image.open(BytesIO(jpeg))
+        
+        # Apply configured transformations
+        img = self._apply_image_transforms(img)
+        
+        # Convert to pygame surface (transforms always yield RGB): frombuffer
+        # wraps the pixel data without copying it, _publish_frame() then makes
+        # the one copy needed to get the display format
+        return pygame.image.frombuffer(img.tobytes(), img.size, 'RGB')
+    
+    def _publish_frame(self, frame):
+        """
+        Copy a decoded frame into the back frame buffer and make it the front one.
+        
+        Args:
+            frame: pygame Surface with the frame, in any pixel format
+        """
+        size = frame.get_size()
+        bufs = self._frame_bufs
+        if bufs is None or bufs[0].get_size() != size:
+            # First frame or new frame size: the old buffers are left to the
+            # draw that may still hold one of them
+            bufs = [pygame.Surface(size).convert() for _ in range(2)]
+            front_idx = 1
+        else:
+            front_idx = self._front_idx
+        
+        # Blitting converts to the display format, so drawing the frame doesn't
+        bufs[1 - front_idx].blit(frame, (0, 0))
+        
+        # Cleared before publishing, so the draw that sets it again is always
+        # for this frame
+        self._frame_consumed.clear()
+        with self.frame_lock:
+            self._frame_bufs = bufs
+            self._front_idx = 1 - front_idx
+            self.frame_seq += 1
+    
     def _apply_image_transforms(self, img):
         """Apply configured transformations to image.
         
@@ -900,84 +1643,177 @@ class SteeringWheelUI:
             img: PIL Image object
             
         Returns:
-            Transformed PIL Image
+            Transformed PIL Image (RGB)
         """
-        display_cfg = self.stream_config.get('display', {})
+        from PIL import Image
         
-        # Apply flip transformations
-        if display_cfg.get('flip_horizontal', False):
-            img = img.transpose(Image.FLIP_LEFT_RIGHT)
-        if display_cfg.get('flip_vertical', False):
-            img = img.transpose(Image.FLIP_TOP_BOTTOM)
-        
-        # Apply rotation
+        # Read all settings once
+        display_cfg = self.stream_config.get('display', {})
+        flip_h = display_cfg.get('flip_horizontal', False)
+        flip_v = display_cfg.get('flip_vertical', False)
         rotation = display_cfg.get('rotation', 0)
-        if rotation == 90:
-            img = img.transpose(Image.ROTATE_270)
-        elif rotation == 180:
-            img = img.transpose(Image.ROTATE_180)
-        elif rotation == 270:
-            img = img.transpose(Image.ROTATE_90)
-        
-        # Apply brightness adjustment
+        if rotation not in (90, 180, 270):
+            rotation = 0
         brightness = display_cfg.get('brightness', 1.0)
-        if brightness != 1.0:
-            enhancer = ImageEnhance.Brightness(img)
-            img = enhancer.enhance(brightness)
-        
-        # Apply contrast adjustment
         contrast = display_cfg.get('contrast', 1.0)
-        if contrast != 1.0:
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(contrast)
-        
-        # Apply saturation adjustment
         saturation = display_cfg.get('saturation', 1.0)
-        if saturation != 1.0:
-            enhancer = ImageEnhance.Color(img)
-            img = enhancer.enhance(saturation)
+        
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        
+        # Nothing to do at default settings
+        if (not flip_h and not flip_v and rotation == 0
+                and brightness == 1.0 and contrast == 1.0 and saturation == 1.0):
+            return img
+        
+        # Apply flips and rotation as a single transpose
+        if flip_v:
+            # Flipping vertically is flipping horizontally and rotating 180 degrees
+            flip_h = not flip_h
+            rotation = (rotation + 180) % 360
+        method = ORIENTATION_TRANSPOSE[(bool(flip_h), rotation)]
+        if method is not None:
+            img = img.transpose(getattr(Image, method))
+        
+        # Apply brightness, contrast and saturation adjustments
+        if saturation == 1.0:
+            # Per-channel only: an integer lookup table is cheaper than a matrix
+            if brightness != 1.0 or contrast != 1.0:
+                img = img.point(self._tone_lut(img, brightness, contrast))
+        else:
+            img = img.convert('RGB', self._color_matrix(img, brightness, contrast, saturation))
         
         return img
     
-    def _draw_stream_video(self):
-        """Draw MJPEG stream video in center area."""
-        # Get frame dimensions (use most of screen except panels area)
+    @staticmethod
+    def _contrast_mean(img, brightness, contrast):
+        """Mean gray level of the brightened image, which contrast blends towards."""
+        if contrast == 1.0:
+            return 0
+        from PIL import ImageStat
+        return int(ImageStat.Stat(img.convert('L')).mean[0] * brightness + 0.5)
+    
+    def _tone_lut(self, img, brightness, contrast):
+        """
+        Get a lookup table applying brightness and contrast.
+        
+        Same result as the brightness and contrast part of _color_matrix(),
+        computed in 8.8 fixed point and clamped to 0-255, so that
+        Image.point() adjusts the pixels through an integer table instead of
+        per-pixel float math. Tables are cached by their fixed-point factors,
+        which only change with the settings and the image mean.
+        
+        Args:
+            img: PIL Image (RGB) the table is built for
+            brightness, contrast: Enhancement factors (1.0 = unchanged)
+            
+        Returns:
+            768-entry table (R, G and B) for Image.point()
+        """
+        gain_q8 = int(brightness * contrast * 256 + 0.5)
+        offset_q8 = int((1.0 - contrast) * self._contrast_mean(img, brightness, contrast) * 256)
+        key = (gain_q8, offset_q8)
+        lut = self._tone_luts.get(key)
+        if lut is None:
+            if len(self._tone_luts) >= 256:
+                self._tone_luts.clear()
+            lut = [min(max((v * gain_q8 + offset_q8 + 128) >> 8, 0), 255) for v in range(256)] * 3
+            self._tone_luts[key] = lut
+        return lut
+    
+    @staticmethod
+    def _color_matrix(img, brightness, contrast, saturation):
+        """
+        Build an RGB conversion matrix applying brightness, contrast and saturation.
+        
+        Same formulas as PIL's ImageEnhance Brightness, Contrast and Color applied
+        in that order, combined into one affine transform so the image is
+        processed in a single pass.
+        
+        Args:
+            img: PIL Image (RGB) the matrix is built for
+            brightness, contrast, saturation: Enhancement factors (1.0 = unchanged)
+            
+        Returns:
+            12-tuple matrix for Image.convert('RGB', matrix)
+        """
+        gain = brightness * contrast
+        gray_mix = (1.0 - saturation) * gain
+        offset = (1.0 - contrast) * SteeringWheelUI._contrast_mean(img, brightness, contrast)
+        
+        # Saturation blends each channel towards the luminance (ITU-R 601-2 luma)
+        matrix = []
+        for channel in range(3):
+            row = [0.299 * gray_mix, 0.587 * gray_mix, 0.114 * gray_mix, offset]
+            row[channel] += saturation * gain
+            matrix.extend(row)
+        return tuple(matrix)
+    
+    def _video_rect(self):
+        """Screen rectangle of the MJPEG stream video area."""
+        # Use most of screen except panels area
         panel_height = int(self.height * 0.25)
         margin = int(self.width * 0.01)
         
         # Video area: full width, from top to just above panels
-        video_x = 0
-        video_y = 0
-        video_width = self.width
-        video_height = self.height - panel_height - margin
+        return pygame.Rect(0, 0, self.width, self.height - panel_height - margin)
+    
+    def _draw_stream_video(self):
+        """
+        Draw MJPEG stream video in center area, if a new frame arrived since the last draw.
+        
+        Returns:
+            True if the video area was drawn
+        """
+        with self.frame_lock:
+            bufs = self._frame_bufs
+            frame = bufs[self._front_idx] if bufs else None
+            frame_seq = self.frame_seq
+        if frame_seq == self._stream_drawn_seq:
+            return False
+        self._stream_drawn_seq = frame_seq
+        self._frame_consumed.set()
+        
+        video_x, video_y, video_width, video_height = self._video_rect()
         
         # Draw video background
         pygame.draw.rect(self.screen, DARK_GRAY, (video_x, video_y, video_width, video_height))
         
         # Draw current frame if available
-        if self.current_frame:
-            with self.frame_lock:
-                frame = self.current_frame
-                if frame:
-                    # Scale frame to fit video area
-                    frame_w, frame_h = frame.get_size()
-                    scale = min(video_width / frame_w, video_height / frame_h)
-                    new_w = int(frame_w * scale)
-                    new_h = int(frame_h * scale)
-                    
-                    scaled_frame = pygame.transform.scale(frame, (new_w, new_h))
-                    # Center frame
-                    offset_x = (video_width - new_w) // 2
-                    offset_y = (video_height - new_h) // 2
-                    self.screen.blit(scaled_frame, (video_x + offset_x, video_y + offset_y))
+        if frame:
+            # Scale frame to fit video area
+            frame_w, frame_h = frame.get_size()
+            scale = min(video_width / frame_w, video_height / frame_h)
+            new_w = int(frame_w * scale)
+            new_h = int(frame_h * scale)
+            
+            # Convert and scale only when a new frame arrived or the video
+            # area changed; otherwise the last scaled frame is blitted again.
+            # Scaling happens once per stream frame, so it can afford smoothscale
+            scaled_key = (frame_seq, new_w, new_h)
+            scaled_frame = self._stream_scaled
+            if scaled_key != self._stream_scaled_key:
+                if scaled_frame is None or scaled_frame.get_size() != (new_w, new_h):
+                    scaled_frame = self._stream_scaled = pygame.Surface((new_w, new_h)).convert()
+                # Frames are in the display format already (see _publish_frame),
+                # so scaling and blitting don't convert pixels
+                pygame.transform.smoothscale(frame, (new_w, new_h), scaled_frame)
+                self._stream_scaled_key = scaled_key
+            
+            # Center frame
+            offset_x = (video_width - new_w) // 2
+            offset_y = (video_height - new_h) // 2
+            self.screen.blit(scaled_frame, (video_x + offset_x, video_y + offset_y))
         else:
             # Show loading message
             loading_text = "Stream connecting..."
-            text_surface = self.font_medium.render(loading_text, True, LIGHT_GRAY)
+            text_surface = self._render_cached(loading_text, self.font_medium, LIGHT_GRAY)
             text_rect = text_surface.get_rect(
                 center=(video_x + video_width // 2, video_y + video_height // 2)
             )
-            self.screen.blit(text_surface, text_rect)        
+            self.screen.blit(text_surface, text_rect)
+        return True
+    
     def run(self):
         """Main loop for the UI."""
         # Check for connected joysticks
@@ -990,11 +1826,13 @@ class SteeringWheelUI:
         # Initialize first joystick (steering wheel)
         self.joystick = pygame.joystick.Joystick(0)
         self.joystick.init()
+        self._joystick_id = self.joystick.get_instance_id()
+        self._build_input_plan()
         
         self._add_message(f"Device: {self.joystick.get_name()}", GREEN)
         
         # Initialize time tracking
-        self.last_time = time.time()
+        self.last_time = time.perf_counter()
         
         # Activate driving mode
         if self.driving_mode:
@@ -1002,6 +1840,12 @@ class SteeringWheelUI:
         
         self.running = True
         
+        # Poll input once so the first frame has a snapshot, then hand polling
+        # over to the input thread
+        self._telemetry_snapshot = self._poll_input()
+        self._input_thread = threading.Thread(target=self._input_loop, daemon=True)
+        self._input_thread.start()
+        
         while self.running:
             # Process events
             for event in pygame.event.get():
@@ -1012,20 +1856,39 @@ class SteeringWheelUI:
                         self.running = False
                 elif event.type == pygame.VIDEORESIZE:
                     self._handle_resize()
+                elif event.type in (pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN,
+                                    pygame.JOYBUTTONUP, pygame.JOYHATMOTION):
+                    self._mark_dirty(event)
+            
+            # Without the input thread nothing reaches the outputs anymore:
+            # stop instead of rendering a stale snapshot
+            if not self._input_thread.is_alive():
+                logger.error("Input thread stopped, exiting")
+                self.running = False
+                break
             
-            # Send joystick data to output manager (if connected)
-            self._send_joystick_data()
+            # Use the latest input snapshot for this whole frame
+            snapshot = self._telemetry_snapshot
+            self._frame_data = snapshot['data']
+            self._frame_processed = snapshot['processed']
+            self._frame_telemetry = snapshot['telemetry']
             
             # Draw interface
-            self._draw_interface()
+            dirty = self._draw_interface()
             
-            # Update display
-            pygame.display.flip()
+            # Update display (only the areas that changed)
+            pygame.display.update(dirty)
+            
+            # The snapshot is only used for the frame it was taken for
+            self._frame_data = None
+            self._frame_processed = None
+            self._frame_telemetry = None
             self.clock.tick(60)  # 60 FPS
         
         # Cleanup
-        if self.output_manager and self.output_manager.driver.connected:
-            self.output_manager.disconnect()
+        self._input_thread.join(timeout=1.0)
+        if self.output_manager:
+            self.output_manager.shutdown()
         
         pygame.quit()
         return True
@@ -2,6 +2,7 @@
 Input management package for handling input device mappings.
 """
 
-from .input_mapper import InputMapper, InputConfig
+from .input_mapper import InputMapper, InputConfig, CompiledInputConfig
+from ._processing import AxisProcessor
 
-__all__ = ['InputMapper', 'InputConfig']
+__all__ = ['InputMapper', 'InputConfig', 'CompiledInputConfig', 'AxisProcessor']
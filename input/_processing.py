@@ -0,0 +1,93 @@
+"""
+Axis processing kernel.
+Compiled to native code with Numba when it is installed, plain Python otherwise.
+"""
+
+from array import array
+from typing import Iterable, Sequence
+
+try:
+    from numba import njit
+    import numpy as np  # always present alongside Numba
+
+    def _kernel_view(buf):
+        """Zero-copy ndarray view of a typed array (compiled kernels need ndarrays)."""
+        return np.asarray(memoryview(buf))
+except ImportError:  # Numba is optional
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def _kernel_view(buf):
+        """Typed arrays are used as-is by the pure-Python kernel."""
+        return buf
+
+
+@njit(cache=True, fastmath=True)
+def process_axes(raw, deadzone, scale, out):
+    """
+    Apply deadzone, inversion/sensitivity and clamping to a batch of axis values.
+
+    Args:
+        raw: Raw axis values (-1 to 1)
+        deadzone: Deadzone per axis
+        scale: Signed scale per axis (sensitivity, negative when inverted)
+        out: Receives the processed values
+    """
+    for i in range(len(raw)):
+        value = raw[i]
+        if abs(value) < deadzone[i]:
+            value = 0.0
+        value *= scale[i]
+        out[i] = -1.0 if value < -1.0 else (1.0 if value > 1.0 else value)
+
+
+class AxisProcessor:
+    """
+    Processes all axes of a device in one kernel call, using per-axis
+    parameters stored in parallel typed arrays.
+    """
+
+    def __init__(self, keys: Sequence[str], deadzones: Sequence[float], scales: Sequence[float]):
+        """
+        Initialize the processor.
+
+        Args:
+            keys: Data key of each axis, in axis ID order
+            deadzones: Deadzone of each axis (0.0 for none)
+            scales: Signed scale of each axis (1.0 to pass values through)
+        """
+        self.keys = list(keys)
+        count = len(self.keys)
+        self.ids = range(count)  # Axis IDs, for reading the device
+        self._raw = array('d', bytes(8 * count))
+        self._out = array('d', bytes(8 * count))
+        self._deadzone = array('d', deadzones)
+        self._scale = array('d', scales)
+        self._views = tuple(map(_kernel_view, (self._raw, self._deadzone, self._scale, self._out)))
+
+    def process(self, values: Iterable[float]) -> array:
+        """
+        Process one reading of every axis.
+
+        Args:
+            values: Raw axis values, in axis ID order (one per axis)
+
+        Returns:
+            Processed values (reused by the next call)
+        """
+        # Fill the preallocated input buffer in place (the kernel views alias it)
+        raw = self._raw
+        for i, value in enumerate(values):
+            raw[i] = value
+        process_axes(*self._views)
+        return self._out
+
+    def __len__(self):
+        return len(self.keys)
+
+
+# Compile once at import so the first frame doesn't pay for it
+AxisProcessor(['axis_0'], [0.05], [1.0]).process([0.5])
@@ -3,9 +3,24 @@ Input mapping configuration loader and manager.
 Handles loading, validation, and access to input configuration files.
 """
 
-import json
 import os
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+from common import loads, dumps, JSONDecodeError
+
+
+# Project root, resolved once (config directories are relative to it)
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class CompiledInputConfig:
+    """
+    Flat form of an InputConfig for per-frame use: plain tuples sorted by
+    control ID, with no dict lookups left to do.
+    """
+    axes: List[Tuple[int, str, float, float, float]]  # (axis_id, action, deadzone, inversion sign, sensitivity)
+    buttons: List[Tuple[int, str]]  # (button_id, action)
 
 
 class InputConfig:
@@ -28,6 +43,26 @@ class InputConfig:
         self.buttons = config_data.get("buttons", {})
         self.hats = config_data.get("hats", {})
         
+        # Reverse lookups (control ID -> action), the first action listed wins
+        self._axis_actions: Dict[int, str] = {}
+        for action, config in self.axes.items():
+            if "axis_id" in config:
+                self._axis_actions.setdefault(config["axis_id"], action)
+        self._button_actions: Dict[int, str] = {}
+        for action, config in self.buttons.items():
+            if "button_id" in config:
+                self._button_actions.setdefault(config["button_id"], action)
+        
+        # Axis processing parameters per action: (deadzone, inversion sign, sensitivity)
+        self._axis_params: Dict[str, Tuple[float, float, float]] = {
+            action: (
+                config.get("deadzone", 0.0),
+                -1.0 if config.get("inverted", False) else 1.0,
+                config.get("sensitivity", 1.0),
+            )
+            for action, config in self.axes.items()
+        }
+        
     def get_axis_mapping(self, action: str) -> Optional[Dict[str, Any]]:
         """
         Get axis configuration for a specific action.
@@ -88,10 +123,7 @@ class InputConfig:
         Returns:
             Action name or None if not mapped
         """
-        for action, config in self.buttons.items():
-            if config.get("button_id") == button_id:
-                return action
-        return None
+        return self._button_actions.get(button_id)
     
     def get_action_for_axis(self, axis_id: int) -> Optional[str]:
         """
@@ -103,10 +135,35 @@ class InputConfig:
         Returns:
             Action name or None if not mapped
         """
-        for action, config in self.axes.items():
-            if config.get("axis_id") == axis_id:
-                return action
-        return None
+        return self._axis_actions.get(axis_id)
+    
+    def get_axis_params(self, action: str) -> Optional[Tuple[float, float, float]]:
+        """
+        Get the processing parameters of an axis action.
+        
+        Args:
+            action: Action name
+            
+        Returns:
+            Tuple of (deadzone, inversion sign (1.0 or -1.0), sensitivity),
+            or None if the action isn't mapped
+        """
+        return self._axis_params.get(action)
+    
+    def compile(self) -> CompiledInputConfig:
+        """
+        Flatten the axis and button mappings for per-frame use.
+        
+        Returns:
+            CompiledInputConfig with the mapped axes and buttons
+        """
+        return CompiledInputConfig(
+            axes=[
+                (axis_id, action) + self._axis_params[action]
+                for axis_id, action in sorted(self._axis_actions.items())
+            ],
+            buttons=sorted(self._button_actions.items()),
+        )
     
     def apply_axis_processing(self, action: str, raw_value: float) -> float:
         """
@@ -119,24 +176,19 @@ class InputConfig:
         Returns:
             Processed axis value
         """
-        mapping = self.get_axis_mapping(action)
-        if not mapping:
+        params = self._axis_params.get(action)
+        if params is None:
             return raw_value
+        deadzone, sign, sensitivity = params
         
         value = raw_value
         
         # Apply deadzone
-        deadzone = mapping.get("deadzone", 0.0)
         if abs(value) < deadzone:
             value = 0.0
         
-        # Apply inversion
-        if mapping.get("inverted", False):
-            value = -value
-        
-        # Apply sensitivity
-        sensitivity = mapping.get("sensitivity", 1.0)
-        value *= sensitivity
+        # Apply inversion and sensitivity
+        value *= sign * sensitivity
         
         # Clamp to -1 to 1 range
         value = max(-1.0, min(1.0, value))
@@ -177,8 +229,7 @@ class InputMapper:
             ValueError: If config file is invalid
         """
         # Determine config directory path
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        config_dir = os.path.join(script_dir, self.CONFIG_DIR)
+        config_dir = os.path.join(_PROJECT_DIR, self.CONFIG_DIR)
         default_path = os.path.join(config_dir, self.DEFAULT_CONFIG_FILE)
         
         return self.load_config(default_path)
@@ -198,26 +249,29 @@ class InputMapper:
             ValueError: If config file is invalid JSON
         """
         # If path doesn't exist and it's just a filename, try in config directory
-        if not os.path.exists(config_path):
-            if not os.path.sep in config_path and not '/' in config_path:
-                # It's just a filename, try in config directory
-                script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                config_dir = os.path.join(script_dir, self.CONFIG_DIR)
-                config_path = os.path.join(config_dir, config_path)
-            
-            if not os.path.exists(config_path):
-                raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        # (opening directly rather than checking existence first)
+        candidates = [config_path]
+        if not os.path.sep in config_path and not '/' in config_path:
+            candidates.append(os.path.join(_PROJECT_DIR, self.CONFIG_DIR, config_path))
+        for config_path in candidates:
+            try:
+                with open(config_path, 'rb') as f:
+                    raw = f.read()
+                break
+            except FileNotFoundError:
+                continue
+        else:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = loads(raw)
             
             self.config = InputConfig(config_data)
             self.config_path = config_path
             
             return self.config
             
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in configuration file: {e}")
     
     def get_config(self) -> Optional[InputConfig]:
@@ -255,8 +309,8 @@ class InputMapper:
             "hats": self.config.hats
         }
         
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, indent=2)
+        with open(save_path, 'wb') as f:
+            f.write(dumps(config_data, indent=True))
     
     def list_available_configs(self) -> list:
         """
@@ -265,15 +319,12 @@ class InputMapper:
         Returns:
             List of configuration file names
         """
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        config_dir = os.path.join(script_dir, self.CONFIG_DIR)
+        config_dir = os.path.join(_PROJECT_DIR, self.CONFIG_DIR)
         
-        if not os.path.exists(config_dir):
+        try:
+            with os.scandir(config_dir) as entries:
+                # is_file() uses the type from the directory listing, no extra stat
+                return [entry.name for entry in entries
+                        if entry.name.endswith('.json') and entry.is_file()]
+        except FileNotFoundError:
             return []
-        
-        configs = []
-        for filename in os.listdir(config_dir):
-            if filename.endswith('.json'):
-                configs.append(filename)
-        
-        return configs
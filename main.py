@@ -4,11 +4,11 @@ Main entry point for the application.
 """
 
 import argparse
-import json
-import os
+import logging
 from gui import SteeringWheelUI
 from input import InputMapper
 from driving_modes import DirectMode, CarSimMode
+from common import loads
 
 
 def parse_arguments():
@@ -76,6 +76,9 @@ Examples:
 
 def main():
     """Initialize and run the steering wheel UI."""
+    # Show driver messages (output package loggers) on the console
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     # Parse command-line arguments
     args = parse_arguments()
     
@@ -143,6 +146,9 @@ def main():
         driving_mode = DirectMode()
         print(f"✓ Driving mode: {driving_mode.name} - {driving_mode.description}")
     
+    if input_config:
+        driving_mode.set_input_schema(list(input_config.axes) + list(input_config.buttons))
+    
     # Initialize and run UI with configuration
     ui = SteeringWheelUI(
         width=1200,
@@ -156,13 +162,16 @@ def main():
     stream_url = args.stream
     
     # If no stream URL provided via command line, try to load from config file
-    if not stream_url and args.stream_config and os.path.exists(args.stream_config):
+    # (a missing file is skipped)
+    if not stream_url and args.stream_config:
         try:
-            with open(args.stream_config, 'r') as f:
-                stream_config = json.load(f)
+            with open(args.stream_config, 'rb') as f:
+                stream_config = loads(f.read())
                 if 'stream' in stream_config and 'url' in stream_config['stream']:
                     stream_url = stream_config['stream']['url']
                     print(f"✓ Loaded stream URL from config: {stream_url}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"✗ Warning: Could not load stream config: {e}")
     
@@ -1,12 +1,31 @@
 """
 Output driver package.
 Provides different output methods for sending data to RC vehicles.
+
+Driver classes are imported on first access, so only the dependencies of
+the drivers actually used (pyserial, requests) are loaded.
 """
 
+import importlib
+
 from .base_driver import BaseDriver
-from .serial_driver import SerialDriver
-from .http_driver import HttpDriver
-from .debug_driver import DebugDriver
-from .udp_driver import UdpDriver
+
+# Driver class name -> module defining it
+_DRIVER_MODULES = {
+    'SerialDriver': 'serial_driver',
+    'HttpDriver': 'http_driver',
+    'DebugDriver': 'debug_driver',
+    'UdpDriver': 'udp_driver',
+}
 
 __all__ = ['BaseDriver', 'SerialDriver', 'HttpDriver', 'DebugDriver', 'UdpDriver']
+
+
+def __getattr__(name):
+    """Import a driver class on first access (PEP 562)."""
+    module_name = _DRIVER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    driver_class = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = driver_class  # Later accesses don't go through __getattr__
+    return driver_class
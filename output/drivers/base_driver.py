@@ -3,8 +3,37 @@ Base driver class for output methods.
 All output drivers should inherit from this class.
 """
 
+import copy
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from common import loads
+
+
+# Parsed config files: path -> ((mtime_ns, size), config)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def load_json_cached(path: str) -> Dict[str, Any]:
+    """
+    Load a JSON config file, parsing it again only when it changed on disk.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Configuration dictionary (a copy, free to modify)
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, 'rb') as f:
+            cached = _CONFIG_CACHE[path] = (stamp, loads(f.read()))
+    return copy.deepcopy(cached[1])
 
 
 class BaseDriver(ABC):
@@ -62,6 +91,15 @@ class BaseDriver(ABC):
         Get the current status of the driver.
         
         Returns:
-            Dictionary with status information
+            Dictionary with status information (may be updated in place by
+            the next call: copy it to keep it)
+        """
+        pass
+    
+    @classmethod
+    def close_all(cls):
+        """
+        Release resources the driver class keeps across connections (called
+        once at shutdown). Drivers that keep none don't override this.
         """
         pass
@@ -3,10 +3,15 @@ Debug output driver for displaying control data in the GUI.
 Stores all input data for real-time display.
 """
 
-import json
+import logging
 import os
 from typing import Dict, Any, Optional
-from .base_driver import BaseDriver
+from .base_driver import BaseDriver, load_json_cached
+
+logger = logging.getLogger(__name__)
+
+# Frames the connect/disconnect messages
+_SEP = "=" * 60
 
 
 class DebugDriver(BaseDriver):
@@ -31,6 +36,15 @@ class DebugDriver(BaseDriver):
         self.error_message = None
         self._print_count = 0
         self.last_data = {}
+        
+        # Returned by get_status(), which updates it in place
+        self._status = {
+            'type': 'debug',
+            'connected': False,
+            'frames_received': 0,
+            'last_data': self.last_data,
+            'error': None
+        }
     
     @staticmethod
     def _load_config_file() -> Dict[str, Any]:
@@ -39,53 +53,48 @@ class DebugDriver(BaseDriver):
         config_dir = os.path.join(os.path.dirname(driver_dir), 'configs')
         config_path = os.path.join(config_dir, DebugDriver.CONFIG_FILE)
         
-        if not os.path.exists(config_path):
+        try:
+            return load_json_cached(config_path)
+        except FileNotFoundError:
             # Return default config if file doesn't exist
             return {"driver_type": "debug", "display_in_gui": True}
-        
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
     
     def connect(self) -> bool:
         """Establish debug connection."""
         self.connected = True
         self.error_message = None
         self.last_data = {}
-        print("\n" + "="*60)
-        print("DEBUG DRIVER CONNECTED - Data will display in GUI")
-        print("="*60 + "\n")
+        logger.info("\n%s\nDEBUG DRIVER CONNECTED - Data will display in GUI\n%s\n", _SEP, _SEP)
         return True
     
     def disconnect(self) -> bool:
         """Close debug connection."""
         self.connected = False
         self.error_message = None
-        print("\n" + "="*60)
-        print("DEBUG DRIVER DISCONNECTED")
-        print(f"Total frames received: {self._print_count}")
-        print("="*60 + "\n")
+        logger.info("\n%s\nDEBUG DRIVER DISCONNECTED\nTotal frames received: %d\n%s\n",
+                    _SEP, self._print_count, _SEP)
         return True
     
     def send_data(self, data: Dict[str, Any]) -> bool:
-        """Store control data for GUI display."""
+        """Store control data for GUI display (kept, not copied: don't modify it afterwards)."""
         if not self.connected:
             self.error_message = "Debug driver not connected"
             return False
         
         try:
             self._print_count += 1
-            self.last_data = data.copy()
+            # Replaced rather than filled in place: the GUI reads it from another thread
+            self.last_data = data
             return True
         except Exception as e:
             self.error_message = str(e)
             return False
     
     def get_status(self) -> Dict[str, Any]:
-        """Get debug driver status."""
-        return {
-            'type': 'debug',
-            'connected': self.connected,
-            'frames_received': self._print_count,
-            'last_data': self.last_data,
-            'error': self.error_message
-        }
+        """Get debug driver status (updated in place by the next call: copy it to keep it)."""
+        status = self._status
+        status['connected'] = self.connected
+        status['frames_received'] = self._print_count
+        status['last_data'] = self.last_data
+        status['error'] = self.error_message
+        return status
@@ -3,11 +3,16 @@ HTTP output driver for communicating with RC vehicles.
 Sends control data over HTTP requests.
 """
 
-import json
 import os
 from typing import Dict, Any, Optional
 import requests
-from .base_driver import BaseDriver
+from requests.adapters import HTTPAdapter
+from common import dumps
+from .base_driver import BaseDriver, load_json_cached
+
+
+# Headers of every control request (the body is always JSON)
+_JSON_HEADERS = {'Content-Type': 'application/json'}
 
 
 class HttpDriver(BaseDriver):
@@ -39,7 +44,36 @@ class HttpDriver(BaseDriver):
         self.endpoint = config.get('endpoint', '/control')
         self.timeout = config.get('timeout', 2.0)
         self.url = f"http://{self.host}:{self.port}{self.endpoint}"
+        self._health_url = f"http://{self.host}:{self.port}/health"
         self.error_message = None
+        self._session = self._create_session()
+        self._control_request = None  # Prepared by connect(), see _prepare_control_request
+        self._send_settings = None
+        
+        # Returned by get_status(), which only updates the fields that change
+        self._status = {
+            'type': 'http',
+            'connected': False,
+            'url': self.url,
+            'timeout': self.timeout,
+            'error': None
+        }
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create the session used for all requests, so that one kept-alive
+        connection is reused instead of opening a new one per request.
+        
+        Returns:
+            New requests Session
+        """
+        session = requests.Session()
+        # Control frames are sent one at a time and are stale by the time a
+        # retry would go out, so don't retry
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+        session.mount('http://', adapter)
+        return session
     
     @staticmethod
     def _load_config_file() -> Dict[str, Any]:
@@ -57,12 +91,11 @@ class HttpDriver(BaseDriver):
         config_dir = os.path.join(os.path.dirname(driver_dir), 'configs')
         config_path = os.path.join(config_dir, HttpDriver.CONFIG_FILE)
         
-        if not os.path.exists(config_path):
+        try:
+            return load_json_cached(config_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"HTTP config file not found: {config_path}")
         
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-        
     def connect(self) -> bool:
         """
         Establish HTTP connection (ping the server).
@@ -75,13 +108,18 @@ class HttpDriver(BaseDriver):
                 self.error_message = "Host not specified"
                 return False
             
+            # A previous disconnect() closed the session
+            if self._session is None:
+                self._session = self._create_session()
+            
             # Try to ping the server
-            response = requests.get(
-                f"http://{self.host}:{self.port}/health",
+            response = self._session.get(
+                self._health_url,
                 timeout=self.timeout
             )
             
             if response.status_code == 200:
+                self._prepare_control_request()
                 self.connected = True
                 self.error_message = None
                 return True
@@ -102,6 +140,20 @@ class HttpDriver(BaseDriver):
             self.connected = False
             return False
     
+    def _prepare_control_request(self):
+        """
+        Prepare the control POST once, so that send_data only replaces its
+        body instead of having requests build a new request (and scan the
+        environment for proxy settings) on every frame.
+        """
+        self._control_request = self._session.prepare_request(
+            requests.Request('POST', self.url, headers=_JSON_HEADERS)
+        )
+        # Proxy and TLS settings from the environment, as Session.request would use
+        self._send_settings = self._session.merge_environment_settings(
+            self.url, {}, None, None, None
+        )
+    
     def disconnect(self) -> bool:
         """
         Close HTTP connection.
@@ -111,6 +163,9 @@ class HttpDriver(BaseDriver):
         """
         self.connected = False
         self.error_message = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
         return True
     
     def send_data(self, data: Dict[str, Any]) -> bool:
@@ -128,11 +183,17 @@ class HttpDriver(BaseDriver):
             return False
         
         try:
-            # Send POST request with JSON data
-            response = requests.post(
-                self.url,
-                json=data,
-                timeout=self.timeout
+            # Send POST request with JSON data, serialized here rather than
+            # by requests so the encoder and headers are built only once.
+            # Only the sender thread sends, so the prepared request is reused
+            request = self._control_request
+            body = dumps(data)
+            request.body = body
+            request.headers['Content-Length'] = str(len(body))
+            response = self._session.send(
+                request,
+                timeout=self.timeout,
+                **self._send_settings
             )
             
             if response.status_code in [200, 201, 202, 204]:
@@ -155,12 +216,9 @@ class HttpDriver(BaseDriver):
         Get HTTP driver status.
         
         Returns:
-            Status dictionary
+            Status dictionary (updated in place by the next call: copy it to keep it)
         """
-        return {
-            'type': 'http',
-            'connected': self.connected,
-            'url': self.url,
-            'timeout': self.timeout,
-            'error': self.error_message
-        }
+        status = self._status
+        status['connected'] = self.connected
+        status['error'] = self.error_message
+        return status
@@ -4,15 +4,64 @@ Sends control data over USB serial connection.
 """
 
 import serial
-import json
 import os
+import struct
 from typing import Dict, Any, Optional
-from .base_driver import BaseDriver
+from common import dumps
+from .base_driver import BaseDriver, load_json_cached
+
+
+# Binary control frame, little endian (followed by a CRC8 byte):
+# B = sync byte (0xAA)
+# h = steering * 1000 (-1000 to 1000)
+# h = throttle * 1000 (-1000 to 1000)
+# h = brake * 1000 (-1000 to 1000)
+# B = shift_up (0/1)
+# B = shift_down (0/1)
+_SERIAL_FRAME = struct.Struct('<BhhhBB')
+_SYNC_BYTE = 0xAA
+
+
+def _build_crc8_table(poly: int = 0x07) -> bytes:
+    """
+    Build the CRC-8 lookup table for a polynomial.
+    
+    Args:
+        poly: CRC polynomial (default: 0x07, CRC-8/SMBUS)
+        
+    Returns:
+        256-byte table indexed by (crc ^ byte)
+    """
+    table = bytearray(256)
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table[byte] = crc
+    return bytes(table)
+
+
+_CRC8_TABLE = _build_crc8_table()
+
+
+def _clamp_scaled(value: float) -> int:
+    """Scale a -1 to 1 control value to -1000 to 1000, clamped."""
+    value = int(value * 1000)
+    return -1000 if value < -1000 else (1000 if value > 1000 else value)
 
 
 class SerialDriver(BaseDriver):
     """
     Serial port output driver for RC vehicle control.
+    Sends each frame as a line of JSON, or as a binary frame when 'binary'
+    is set in the config:
+    - 1 byte: sync (0xAA)
+    - 2 bytes: steering * 1000 (int16_t, little endian)
+    - 2 bytes: throttle * 1000 (int16_t, little endian)
+    - 2 bytes: brake * 1000 (int16_t, little endian)
+    - 1 byte: shift_up (uint8_t)
+    - 1 byte: shift_down (uint8_t)
+    - 1 byte: CRC-8 (poly 0x07) of the previous bytes
     """
     
     CONFIG_FILE = "serial.json"
@@ -27,6 +76,7 @@ class SerialDriver(BaseDriver):
                     - 'port': Serial port name (e.g., 'COM3', '/dev/ttyUSB0')
                     - 'baudrate': Baud rate (default: 9600)
                     - 'timeout': Read/write timeout in seconds (default: 1.0)
+                    - 'binary': Send binary frames instead of JSON (default: False)
         """
         # Load config from file if not provided
         if config is None:
@@ -36,8 +86,20 @@ class SerialDriver(BaseDriver):
         self.port = config.get('port')
         self.baudrate = config.get('baudrate', 9600)
         self.timeout = config.get('timeout', 1.0)
+        self.binary = config.get('binary', False)
+        self._frame = bytearray(_SERIAL_FRAME.size + 1)  # Binary frame plus CRC, reused
         self.serial_connection = None
         self.error_message = None
+        
+        # Returned by get_status(), which only updates the fields that change
+        self._status = {
+            'type': 'serial',
+            'connected': False,
+            'port': self.port,
+            'baudrate': self.baudrate,
+            'binary': self.binary,
+            'error': None
+        }
     
     @staticmethod
     def _load_config_file() -> Dict[str, Any]:
@@ -55,12 +117,11 @@ class SerialDriver(BaseDriver):
         config_dir = os.path.join(os.path.dirname(driver_dir), 'configs')
         config_path = os.path.join(config_dir, SerialDriver.CONFIG_FILE)
         
-        if not os.path.exists(config_path):
+        try:
+            return load_json_cached(config_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Serial config file not found: {config_path}")
         
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-        
     def connect(self) -> bool:
         """
         Establish serial connection.
@@ -121,33 +182,60 @@ class SerialDriver(BaseDriver):
             return False
         
         try:
-            # Format data as JSON string
-            json_data = json.dumps(data)
-            # Add newline as message delimiter
-            message = json_data + '\n'
+            if self.binary:
+                self.serial_connection.write(self._pack_frame(data))
+            else:
+                # Format data as JSON, with a newline as message delimiter
+                message = dumps(data) + b'\n'
+                
+                # Send data
+                self.serial_connection.write(message)
             
-            # Send data
-            self.serial_connection.write(message.encode())
+            self.error_message = None
             return True
             
         except Exception as e:
             self.error_message = str(e)
             return False
     
+    def _pack_frame(self, data: Dict[str, Any]) -> bytearray:
+        """
+        Pack control data into the binary frame.
+        
+        Args:
+            data: Dictionary with control values
+        
+        Returns:
+            Frame with its CRC (reused by the next call)
+        """
+        frame = self._frame
+        _SERIAL_FRAME.pack_into(
+            frame, 0, _SYNC_BYTE,
+            _clamp_scaled(data.get('steering', 0.0)),
+            _clamp_scaled(data.get('throttle', 0.0)),
+            _clamp_scaled(data.get('brake', 0.0)),
+            1 if data.get('shift_up') else 0,
+            1 if data.get('shift_down') else 0,
+        )
+        
+        crc = 0
+        table = _CRC8_TABLE
+        for byte in memoryview(frame)[:-1]:
+            crc = table[crc ^ byte]
+        frame[-1] = crc
+        return frame
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Get serial driver status.
         
         Returns:
-            Status dictionary
+            Status dictionary (updated in place by the next call: copy it to keep it)
         """
-        return {
-            'type': 'serial',
-            'connected': self.connected,
-            'port': self.port,
-            'baudrate': self.baudrate,
-            'error': self.error_message
-        }
+        status = self._status
+        status['connected'] = self.connected
+        status['error'] = self.error_message
+        return status
     
     @staticmethod
     def get_available_ports() -> list:
@@ -3,12 +3,54 @@ UDP output driver for communicating with RC vehicles.
 Sends control data over UDP packets to ESP32.
 """
 
-import json
+import logging
 import os
 import socket
 import struct
-from typing import Dict, Any, Optional
-from .base_driver import BaseDriver
+from typing import Dict, Any, Optional, Sequence, Tuple
+from .base_driver import BaseDriver, load_json_cached
+
+logger = logging.getLogger(__name__)
+
+# ESP32 control packet, little endian:
+# H = unsigned short (2 bytes), power
+# B = unsigned char (1 byte), direction
+# h = signed short (2 bytes), steering
+_PACKET = struct.Struct('<HBh')
+
+# Socket send buffer size (bytes). Kept small so that when the network can't
+# keep up, frames are dropped instead of queueing up stale control data
+_SEND_BUFFER_SIZE = 4096
+
+
+def _packet_fields(data: Dict[str, Any]) -> Tuple[int, int, int]:
+    """
+    Convert control data to the ESP32 packet fields.
+    
+    - throttle * 1000 (0-1000)
+    - direction (0, 1, 2)
+    - steering * 1000 (-1000 to 1000)
+    
+    Args:
+        data: Dictionary containing control values
+        
+    Returns:
+        (power, direction, steering), clamped to their ranges
+    """
+    # Clamp with conditional expressions (cheaper than max/min calls)
+    # Power: 0-1000 (uint16_t)
+    power = int(data.get('throttle', 0.0) * 1000)
+    power = 0 if power < 0 else (1000 if power > 1000 else power)
+    
+    # Direction: 0, 1, 2 (uint8_t)
+    direction = int(data.get('direction', 0))
+    direction = 0 if direction < 0 else (2 if direction > 2 else direction)
+    
+    # Steering: -1000 to 1000 (int16_t)
+    steering = int(data.get('steering', 0.0) * 1000)
+    steering = -1000 if steering < -1000 else (1000 if steering > 1000 else steering)
+    
+    return power, direction, steering
 
 
 class UdpDriver(BaseDriver):
@@ -22,6 +64,11 @@ class UdpDriver(BaseDriver):
     
     CONFIG_FILE = "udp.json"
     
+    # Sockets shared by all instances, by target address, with whether they are
+    # connected to it. disconnect() leaves them open for the next connect()
+    # to the same target; close_all() closes them
+    _SOCKET_POOL: Dict[Tuple[str, int], Tuple[socket.socket, bool]] = {}
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize UDP driver.
@@ -31,7 +78,8 @@ class UdpDriver(BaseDriver):
                     Expected keys:
                     - 'host': ESP32 IP address (default: 192.168.4.1)
                     - 'port': UDP port (default: 4210)
-                    - 'timeout': Socket timeout in seconds (default: 0.5)
+                    - 'timeout': Socket timeout in seconds (default: 0.5; unused,
+                      sends never block)
         """
         # Load config from file if not provided
         if config is None:
@@ -42,7 +90,19 @@ class UdpDriver(BaseDriver):
         self.port = config.get('port', 4210)
         self.timeout = config.get('timeout', 0.5)
         self.socket = None
+        self._addr = (self.host, self.port)  # Target address, set again by connect()
+        self._addr_connected = False  # True if the socket is connected to _addr
         self.error_message = None
+        
+        # Returned by get_status(), which only updates the fields that change
+        self._status = {
+            'type': 'udp',
+            'connected': False,
+            'host': self.host,
+            'port': self.port,
+            'timeout': self.timeout,
+            'error': None
+        }
     
     @staticmethod
     def _load_config_file() -> Dict[str, Any]:
@@ -59,8 +119,7 @@ class UdpDriver(BaseDriver):
         config_path = os.path.join(config_dir, UdpDriver.CONFIG_FILE)
         
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return load_json_cached(config_path)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"UDP config file not found: {config_path}. "
@@ -69,7 +128,8 @@ class UdpDriver(BaseDriver):
     
     def connect(self) -> bool:
         """
-        Create UDP socket for sending data.
+        Get a UDP socket for sending data, reusing the pooled one for the
+        same target if any.
         
         Returns:
             True if socket created successfully, False otherwise
@@ -78,41 +138,74 @@ class UdpDriver(BaseDriver):
             if self.socket is not None:
                 self.disconnect()
             
-            # Create UDP socket
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.settimeout(self.timeout)
+            self._addr = (self.host, self.port)
+            self._status['host'], self._status['port'] = self._addr
+            
+            pooled = UdpDriver._SOCKET_POOL.get(self._addr)
+            if pooled is None:
+                # Create UDP socket
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                # Nonblocking: a full send buffer drops the frame (see send_data)
+                # rather than stalling the caller
+                sock.setblocking(False)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SEND_BUFFER_SIZE)
+                addr_connected = False
+            else:
+                sock, addr_connected = pooled
+            
+            # Fixed target: connect the socket once so that sends don't
+            # resolve the address each time
+            if not addr_connected:
+                try:
+                    sock.connect(self._addr)
+                    addr_connected = True
+                except OSError as e:
+                    # e.g. the host name doesn't resolve yet: address every packet instead
+                    logger.warning("UDP socket not connected to target (%s), using sendto", e)
+            
+            UdpDriver._SOCKET_POOL[self._addr] = (sock, addr_connected)
+            self.socket = sock
+            self._addr_connected = addr_connected
             
             self.connected = True
             self.error_message = None
-            print(f"UDP socket created. Target: {self.host}:{self.port}")
+            logger.info("UDP socket %s. Target: %s:%s",
+                        "created" if pooled is None else "reused", self.host, self.port)
             return True
             
         except Exception as e:
             self.error_message = f"Error creating UDP socket: {e}"
-            print(self.error_message)
+            logger.error(self.error_message)
             self.connected = False
             return False
     
     def disconnect(self) -> bool:
         """
-        Close UDP socket.
+        Stop using the UDP socket. It stays open in the pool for the next
+        connect() to the same target (see close_all).
         
         Returns:
-            True if socket closed successfully, False otherwise
+            True if disconnection successful, False otherwise
         """
-        try:
-            if self.socket is not None:
-                self.socket.close()
-                self.socket = None
-            
-            self.connected = False
-            print("UDP socket closed")
-            return True
-            
-        except Exception as e:
-            self.error_message = f"Error closing UDP socket: {e}"
-            print(self.error_message)
-            return False
+        self.socket = None
+        
+        self.connected = False
+        logger.info("UDP driver disconnected")
+        return True
+    
+    @classmethod
+    def close_all(cls):
+        """
+        Close all pooled sockets (called by OutputManager.shutdown(); drivers
+        still connected must connect() again before sending).
+        """
+        for sock, _ in cls._SOCKET_POOL.values():
+            try:
+                sock.close()
+            except OSError as e:
+                logger.error("Error closing UDP socket: %s", e)
+        cls._SOCKET_POOL.clear()
+        logger.info("UDP sockets closed")
     
     def send_data(self, data: Dict[str, Any]) -> bool:
         """
@@ -134,48 +227,85 @@ class UdpDriver(BaseDriver):
             data: Dictionary containing control values
             
         Returns:
-            True if data sent successfully, False otherwise
+            True if data sent successfully, False otherwise (including when
+            the frame was dropped because the send buffer is full)
         """
         if not self.connected or self.socket is None:
             self.error_message = "UDP socket not connected"
             return False
         
         try:
-            # Extract data with default values
-            throttle = data.get('throttle', 0.0)
-            steering = data.get('steering', 0.0)
-            direction = data.get('direction', 0)
-            
-            # Convert to ESP32 format
-            # Power: 0-1000 (uint16_t)
-            power = int(throttle * 1000)
-            power = max(0, min(1000, power))  # Clamp 0-1000
-            
-            # Direction: 0, 1, 2 (uint8_t)
-            direction = int(direction)
-            direction = max(0, min(2, direction))  # Clamp 0-2
-            
-            # Steering: -1000 to 1000 (int16_t)
-            steering = int(steering * 1000)
-            steering = max(-1000, min(1000, steering))  # Clamp -1000 to 1000
-            
-            # Pack data in little endian format
-            # H = unsigned short (2 bytes)
-            # B = unsigned char (1 byte)
-            # h = signed short (2 bytes)
-            packet = struct.pack('<HBh', power, direction, steering)
-            
-            # Send UDP packet
-            self.socket.sendto(packet, (self.host, self.port))
+            # Convert, pack and send the UDP packet
+            self._send_packet(_PACKET.pack(*_packet_fields(data)))
             
             self.error_message = None
             return True
             
+        except BlockingIOError:
+            # Send buffer full: drop the frame, the next one supersedes it anyway
+            self.error_message = "UDP send buffer full, frame dropped"
+            return False
         except Exception as e:
             self.error_message = f"Error sending UDP data: {e}"
-            print(self.error_message)
+            logger.error(self.error_message)
             return False
     
+    def send_batch(self, batch: Sequence[Dict[str, Any]]) -> int:
+        """
+        Send several frames of control data in order, one packet per frame.
+        
+        All packets are packed into a single buffer first and sent as slices
+        of it. The ESP32 reads one frame per packet, so they can't be merged.
+        
+        Args:
+            batch: Dictionaries containing control values (see send_data)
+            
+        Returns:
+            Number of frames sent (stops at the first error)
+        """
+        if not self.connected or self.socket is None:
+            self.error_message = "UDP socket not connected"
+            return 0
+        
+        size = _PACKET.size
+        buffer = bytearray(size * len(batch))
+        pack_into = _PACKET.pack_into
+        for offset, data in zip(range(0, len(buffer), size), batch):
+            pack_into(buffer, offset, *_packet_fields(data))
+        
+        sent = 0
+        try:
+            with memoryview(buffer) as view:
+                for offset in range(0, len(buffer), size):
+                    self._send_packet(view[offset:offset + size])
+                    sent += 1
+            self.error_message = None
+        except BlockingIOError:
+            # Send buffer full: drop the rest of the batch
+            self.error_message = "UDP send buffer full, frames dropped"
+        except Exception as e:
+            self.error_message = f"Error sending UDP data: {e}"
+            logger.error(self.error_message)
+        return sent
+    
+    def _send_packet(self, packet):
+        """
+        Send one packet to the target.
+        
+        Args:
+            packet: Packet bytes (any bytes-like object)
+        """
+        if self._addr_connected:
+            try:
+                self.socket.send(packet)
+            except ConnectionRefusedError:
+                # A connected socket reports "port unreachable" for an earlier
+                # packet on the next send, which is then not sent. Nobody
+                # listening yet is normal for UDP, so send again
+                self.socket.send(packet)
+        else:
+            self.socket.sendto(packet, self._addr)
+    
     def is_connected(self) -> bool:
         """
         Check if UDP socket is ready to send.
@@ -190,16 +320,13 @@ class UdpDriver(BaseDriver):
         Get current driver status.
         
         Returns:
-            Dictionary containing status information
+            Dictionary containing status information (updated in place by
+            the next call: copy it to keep it)
         """
-        return {
-            'type': 'udp',
-            'connected': self.connected,
-            'host': self.host,
-            'port': self.port,
-            'timeout': self.timeout,
-            'error': self.error_message
-        }
+        status = self._status
+        status['connected'] = self.connected
+        status['error'] = self.error_message
+        return status
     
     def __del__(self):
         """
@@ -4,9 +4,47 @@ Manages different output drivers (serial, HTTP, debug, etc.)
 """
 
 import os
-import json
+import logging
+import threading
+import time
+from collections.abc import Mapping
 from typing import Dict, Any, Optional
-from .drivers import BaseDriver, SerialDriver, HttpDriver, DebugDriver, UdpDriver
+from common import dumps
+from . import drivers
+from .drivers import BaseDriver
+
+logger = logging.getLogger(__name__)
+
+
+class _LazyDriverClasses(Mapping):
+    """
+    Read-only mapping of driver type -> driver class.
+    
+    Keys and membership tests don't import anything; a driver module is
+    imported the first time its class is looked up.
+    """
+    
+    def __init__(self, class_names: Dict[str, str]):
+        """
+        Args:
+            class_names: Driver type -> driver class name in output.drivers
+        """
+        self._class_names = class_names
+        
+    def __getitem__(self, driver_type: str) -> type:
+        return getattr(drivers, self._class_names[driver_type])
+    
+    def __iter__(self):
+        return iter(self._class_names)
+    
+    def __len__(self) -> int:
+        return len(self._class_names)
+    
+    def __contains__(self, driver_type) -> bool:
+        return driver_type in self._class_names
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._class_names!r})"
 
 
 class OutputManager:
@@ -15,20 +53,25 @@ class OutputManager:
     Handles switching between different output methods and sending data.
     """
     
-    AVAILABLE_DRIVERS = {
-        'serial': SerialDriver,
-        'http': HttpDriver,
-        'debug': DebugDriver,
-        'udp': UdpDriver
-    }
+    # Driver type -> driver class. Classes are imported when first looked up
+    AVAILABLE_DRIVERS = _LazyDriverClasses({
+        'serial': 'SerialDriver',
+        'http': 'HttpDriver',
+        'debug': 'DebugDriver',
+        'udp': 'UdpDriver'
+    })
     
-    def __init__(self, driver_type: str = 'http', custom_config: Optional[Dict[str, Any]] = None):
+    def __init__(self, driver_type: str = 'http', custom_config: Optional[Dict[str, Any]] = None,
+                 send_rate: Optional[float] = 100.0):
         """
         Initialize output manager with a specific driver.
         
         Args:
             driver_type: Type of driver ('serial', 'http'). Defaults to 'http'
             custom_config: Custom configuration dictionary. If None, loads from driver's config file
+            send_rate: Max frames per second sent to the driver while connected;
+                       frames arriving faster are coalesced to the latest.
+                       None or 0 sends as fast as the driver allows
             
         Raises:
             ValueError: If driver type is not recognized
@@ -42,6 +85,22 @@ class OutputManager:
         self.driver_type = driver_type
         self.driver: Optional[BaseDriver] = self.AVAILABLE_DRIVERS[driver_type](custom_config)
         
+        # Bound methods of the driver, called on every frame
+        self._send = self.driver.send_data
+        self._status = self.driver.get_status
+        
+        # While connected, a sender thread does the driver I/O. send_data()
+        # only fills a single slot: a frame not sent yet is replaced by the
+        # newer one, so a slow driver (or the send rate limit) always sends
+        # the latest data
+        self.send_rate = send_rate
+        self._slot = None
+        self._slot_lock = threading.Lock()
+        self._slot_ready = threading.Event()
+        self._sender = None
+        self._sending = False
+        self._send_error = None  # Last exception raised by a threaded send
+        
     def connect(self) -> bool:
         """
         Connect to the output device.
@@ -49,7 +108,10 @@ class OutputManager:
         Returns:
             True if connection successful, False otherwise
         """
-        return self.driver.connect()
+        connected = self.driver.connect()
+        if connected:
+            self._start_sender()
+        return connected
     
     def disconnect(self) -> bool:
         """
@@ -58,29 +120,112 @@ class OutputManager:
         Returns:
             True if disconnection successful, False otherwise
         """
+        self._stop_sender()
         return self.driver.disconnect()
     
+    def shutdown(self):
+        """
+        Disconnect and release the resources drivers keep across connections
+        (e.g. pooled UDP sockets). Call once when the application exits.
+        """
+        if self.driver.connected:
+            self.disconnect()
+        # Only driver classes already imported can hold anything
+        for driver_class in BaseDriver.__subclasses__():
+            driver_class.close_all()
+    
     def send_data(self, data: Dict[str, Any]) -> bool:
         """
         Send data to the RC vehicle.
         
+        While connected the data is handed to the sender thread and this
+        returns immediately; send errors are reported by get_status().
+        
         Args:
-            data: Dictionary with control values
+            data: Dictionary with control values (not modified afterwards)
                   Expected keys: 'steering', 'throttle', 'brake', 'shift_up', 'shift_down'
         
         Returns:
-            True if data sent successfully, False otherwise
+            True if data was queued or sent successfully, False otherwise
         """
-        return self.driver.send_data(data)
+        if self._sender is None:
+            return self._send(data)
+        
+        with self._slot_lock:
+            self._slot = data
+            self._slot_ready.set()
+        return True
+    
+    def _start_sender(self):
+        """Start the sender thread, if not running."""
+        if self._sender is not None:
+            return
+        self._slot = None
+        self._slot_ready.clear()
+        self._send_error = None
+        self._sending = True
+        self._sender = threading.Thread(target=self._sender_loop, daemon=True)
+        self._sender.start()
+    
+    def _stop_sender(self):
+        """Stop the sender thread, dropping any frame not sent yet."""
+        if self._sender is None:
+            return
+        self._sending = False
+        self._slot_ready.set()
+        # Let an in-flight send finish (or time out) before the driver disconnects
+        self._sender.join(timeout=max(1.0, getattr(self.driver, 'timeout', 0.0)) + 0.5)
+        self._sender = None
+        self._slot = None
+    
+    def _sender_loop(self):
+        """Send the latest queued data until stopped (runs in the sender thread)."""
+        send = self._send  # The driver can't change while the sender runs
+        period = 1.0 / self.send_rate if self.send_rate else 0.0
+        next_send = 0.0
+        while True:
+            self._slot_ready.wait()
+            if not self._sending:
+                return
+            
+            # Hold the frame until its send slot; newer frames replace it meanwhile
+            delay = next_send - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+                if not self._sending:
+                    return
+            
+            with self._slot_lock:
+                data = self._slot
+                self._slot = None
+                self._slot_ready.clear()
+            if data is None:
+                continue
+            next_send = time.perf_counter() + period
+            try:
+                send(data)
+            except Exception as e:
+                # Drivers report their own send errors in their status; this is
+                # one they didn't catch. Log it once per run of failures
+                if self._send_error is None:
+                    logger.exception("Output driver '%s' raised while sending", self.driver_type)
+                self._send_error = f"Send error: {e}"
+            else:
+                self._send_error = None
     
     def get_status(self) -> Dict[str, Any]:
         """
         Get current driver status.
         
         Returns:
-            Status dictionary
+            Status dictionary (updated in place by the next call: copy it to keep it).
+            'error' holds the last exception raised by a threaded send, if any
         """
-        return self.driver.get_status()
+        status = self._status()
+        send_error = self._send_error
+        if send_error is not None:
+            status['error'] = send_error
+        return status
     
     def switch_driver(self, driver_type: str, custom_config: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -95,6 +240,7 @@ class OutputManager:
         """
         try:
             # Disconnect from current driver
+            self._stop_sender()
             if self.driver.connected:
                 self.driver.disconnect()
             
@@ -104,6 +250,8 @@ class OutputManager:
             
             self.driver_type = driver_type
             self.driver = self.AVAILABLE_DRIVERS[driver_type](custom_config)
+            self._send = self.driver.send_data
+            self._status = self.driver.get_status
             
             return True
             
@@ -126,7 +274,7 @@ class OutputManager:
         Load configuration for a specific driver from its config file.
         
         Args:
-            driver_type: Type of driver ('serial', 'http', 'debug')
+            driver_type: Type of driver ('serial', 'http', 'debug', 'udp')
             
         Returns:
             Configuration dictionary
@@ -135,14 +283,9 @@ class OutputManager:
             FileNotFoundError: If config file not found
             ValueError: If driver type is unknown
         """
-        if driver_type == 'serial':
-            return SerialDriver._load_config_file()
-        elif driver_type == 'http':
-            return HttpDriver._load_config_file()
-        elif driver_type == 'debug':
-            return DebugDriver._load_config_file()
-        else:
+        if driver_type not in OutputManager.AVAILABLE_DRIVERS:
             raise ValueError(f"Unknown driver type: {driver_type}")
+        return OutputManager.AVAILABLE_DRIVERS[driver_type]._load_config_file()
     
     @staticmethod
     def save_driver_config(driver_type: str, config: Dict[str, Any]) -> bool:
@@ -155,23 +298,16 @@ class OutputManager:
             True if save successful, False otherwise
         """
         try:
-            if driver_type == 'serial':
-                config_file = SerialDriver.CONFIG_FILE
-            elif driver_type == 'http':
-                config_file = HttpDriver.CONFIG_FILE
-            elif driver_type == 'debug':
-                config_file = DebugDriver.CONFIG_FILE
-            elif driver_type == 'http':
-                config_file = HttpDriver.CONFIG_FILE
-            else:
+            if driver_type not in OutputManager.AVAILABLE_DRIVERS:
                 return False
+            config_file = OutputManager.AVAILABLE_DRIVERS[driver_type].CONFIG_FILE
             
             # Determine config file path
             current_dir = os.path.dirname(os.path.abspath(__file__))
             config_path = os.path.join(current_dir, 'configs', config_file)
             
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            with open(config_path, 'wb') as f:
+                f.write(dumps(config, indent=True))
             
             return True
             
@@ -0,0 +1,35 @@
+"""
+Tests for the CarSim physics step.
+"""
+
+import math
+import unittest
+
+from driving_modes import CarSimMode
+
+
+class InertiaTest(unittest.TestCase):
+    """Speed carry-over at the edges of the inertia range."""
+
+    def _step(self, inertia, speed, delta_time):
+        mode = CarSimMode()
+        mode.inertia = inertia
+        mode.current_speed_percent = speed
+        mode.update(delta_time)
+        return mode.current_speed_percent
+
+    def test_zero_inertia_zero_dt_keeps_speed(self):
+        # Same as the reference inertia ** dt: 0 ** 0 == 1, nothing decays
+        speed = self._step(0.0, 50.0, 0.0)
+        self.assertFalse(math.isnan(speed))
+        self.assertEqual(speed, 50.0)
+
+    def test_zero_inertia_stops_immediately(self):
+        self.assertEqual(self._step(0.0, 50.0, 1.0 / 200.0), 0.0)
+
+    def test_zero_dt_keeps_speed(self):
+        self.assertEqual(self._step(0.88, 50.0, 0.0), 50.0)
+
+
+if __name__ == '__main__':
+    unittest.main()